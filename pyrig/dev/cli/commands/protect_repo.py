@@ -13,6 +13,7 @@ from pyrig.dev.utils.git import (
     DEFAULT_BRANCH,
     create_or_update_ruleset,
     get_github_repo_token,
+    get_github_repo_tokens,
     get_repo,
 )
 from pyrig.src.git import (
@@ -66,10 +67,10 @@ def create_or_update_default_branch_ruleset() -> None:
     Applies pyrig's standard protection rules to the main branch. Updates
     existing ruleset if present.
     """
-    token = get_github_repo_token()
+    tokens = get_github_repo_tokens()
     owner, repo_name = get_repo_owner_and_name_from_git()
     create_or_update_ruleset(
-        token=token,
+        token=tokens,
         owner=owner,
         repo_name=repo_name,
         **get_default_ruleset_params(),
@@ -19,6 +19,7 @@ Example:
 """
 
 from pyrig.dev.configs.base.copy_module import CopyModuleConfigFile
+from pyrig.src.modules.module import get_module_docstring_as_str
 from pyrig.src.string import starts_with_docstring
 
 
@@ -43,9 +44,7 @@ class CopyModuleOnlyDocstringConfigFile(CopyModuleConfigFile):
         Returns:
             Module docstring wrapped in triple quotes with newline.
         """
-        content = super().get_content_str()
-        parts = content.split('"""', 2)
-        return '"""' + parts[1] + '"""\n'
+        return '"""' + get_module_docstring_as_str(cls.get_src_module()) + '"""\n'
 
     @classmethod
     def is_correct(cls) -> bool:
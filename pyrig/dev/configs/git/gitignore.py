@@ -9,6 +9,7 @@ See Also:
     Git documentation: https://git-scm.com/docs/gitignore
 """
 
+from functools import cache
 from pathlib import Path
 
 import requests
@@ -82,7 +83,7 @@ class GitIgnoreConfigFile(ListConfigFile):
         Raises:
             FileNotFoundError: If file doesn't exist.
         """
-        return load_gitignore(path=cls.get_path())
+        return list(load_gitignore(path=cls.get_path()))
 
     @classmethod
     def _dump(cls, config: list[str]) -> None:
@@ -140,6 +141,7 @@ class GitIgnoreConfigFile(ListConfigFile):
 
     @classmethod
     @return_resource_content_on_fetch_error(resource_name="GITIGNORE")
+    @cache
     def get_github_python_gitignore_as_str(cls) -> str:
         """Fetch GitHub's standard Python gitignore patterns.
 
@@ -152,6 +154,7 @@ class GitIgnoreConfigFile(ListConfigFile):
 
         Note:
             Makes HTTP request with 10s timeout. Decorator provides fallback.
+            Successful fetches are cached for the process, failures are not.
         """
         url = "https://raw.githubusercontent.com/github/gitignore/main/Python.gitignore"
         res = requests.get(url, timeout=10)
@@ -10,6 +10,7 @@ See Also:
 """
 
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 
 import requests
@@ -69,8 +70,9 @@ class LicenceConfigFile(TextConfigFile):
 
     @classmethod
     @return_resource_content_on_fetch_error(resource_name="MIT_LICENSE_TEMPLATE")
+    @cache
     def get_mit_license(cls) -> str:
-        """Fetch MIT license from GitHub SPDX API (with fallback)."""
+        """Fetch MIT license from GitHub SPDX API (cached, with fallback)."""
         url = "https://api.github.com/licenses/mit"
         resp = requests.get(url, timeout=10)
         resp.raise_for_status()
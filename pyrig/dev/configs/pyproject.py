@@ -346,7 +346,7 @@ class PyprojectConfigFile(TomlConfigFile):
         return lower
 
     @classmethod
-    def get_supported_python_versions(cls) -> list[Version]:
+    def get_supported_python_versions(cls) -> tuple[Version, ...]:
         """Get all supported Python minor versions within requires-python constraint."""
         constraint = cls.get_project_requires_python()
         version_constraint = VersionConstraint(constraint)
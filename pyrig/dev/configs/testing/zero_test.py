@@ -39,16 +39,12 @@ class ZeroTestConfigFile(PythonTestsConfigFile):
 
     @classmethod
     def get_filename(cls) -> str:
-        """Get the test filename with reversed prefix.
+        """Get the test filename.
 
         Returns:
             str: "test_zero" (extension .py added by parent class).
-
-        Note:
-            Reverses class name parts to convert "zero_test" to "test_zero".
         """
-        filename = super().get_filename()
-        return "_".join(reversed(filename.split("_")))
+        return "test_zero"
 
     @classmethod
     def get_content_str(cls) -> str:
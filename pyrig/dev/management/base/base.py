@@ -31,7 +31,7 @@ import pyrig
 from pyrig.dev import management
 from pyrig.src.modules.class_ import classproperty
 from pyrig.src.modules.package import discover_leaf_subclass_across_dependents
-from pyrig.src.processes import Args
+from pyrig.src.processes import Args, build_args
 
 logger = logging.getLogger(__name__)
 
@@ -81,8 +81,10 @@ class Tool(ABC):
 
         Note:
             Subclasses provide higher-level methods calling this internally.
+            Results are interned via `build_args`, so repeated calls with
+            the same arguments return the same object.
         """
-        return Args((cls.name(), *args))
+        return build_args(cls.name(), args)
 
     @classproperty
     def L(cls) -> type[Self]:  # noqa: N802, N805
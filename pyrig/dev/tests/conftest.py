@@ -31,7 +31,8 @@ for pkg in fixtures_pkgs:
     absolute_path = ModulePath.pkg_type_to_dir_path(pkg)
     relative_path = ModulePath.pkg_name_to_relative_dir_path(pkg.__name__)
 
-    pkg_root = Path(absolute_path.as_posix().removesuffix(relative_path.as_posix()))
+    # walk up one parent per relative part instead of string suffix arithmetic
+    pkg_root = absolute_path.parents[len(relative_path.parts) - 1]
 
     for path in absolute_path.rglob("*.py"):
         rel_plugin_path = path.relative_to(pkg_root)
@@ -9,14 +9,15 @@ Fixtures:
         redirected to tmp_path. Also works for BuilderConfigFile subclasses.
 """
 
-from collections.abc import Callable
-from contextlib import chdir
+from collections.abc import Callable, Generator
+from contextlib import chdir, contextmanager
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from pyrig.dev.configs.base.base import ConfigFile
+from pyrig.src.git import reset_git_caches
 
 
 @pytest.fixture
@@ -36,6 +37,20 @@ def config_file_factory[T: ConfigFile](
         subclass with tmp_path-based file operations.
     """
 
+    @contextmanager
+    def chdir_tmp_path() -> Generator[None, None, None]:
+        """Change to tmp_path with fresh git caches on both sides.
+
+        Owner and repo fall back to the current directory without a git
+        remote, so values cached in one directory must not leak into the other.
+        """
+        reset_git_caches()
+        try:
+            with chdir(tmp_path):
+                yield
+        finally:
+            reset_git_caches()
+
     def _make_test_config(
         base_class: type[T],
     ) -> type[T]:
@@ -67,13 +82,13 @@ def config_file_factory[T: ConfigFile](
             @classmethod
             def _dump(cls, config: dict[str, Any] | list[Any]) -> None:
                 """Dump the config file."""
-                with chdir(tmp_path):
+                with chdir_tmp_path():
                     super()._dump(config)
 
             @classmethod
             def _load(cls) -> dict[str, Any] | list[Any]:
                 """Load the config file."""
-                with chdir(tmp_path):
+                with chdir_tmp_path():
                     return super()._load()
 
             @classmethod
@@ -88,7 +103,7 @@ def config_file_factory[T: ConfigFile](
             @classmethod
             def create_file(cls) -> None:
                 """Create the config file."""
-                with chdir(tmp_path):
+                with chdir_tmp_path():
                     super().create_file()
 
         return TestConfigFile  # ty:ignore[invalid-return-type]
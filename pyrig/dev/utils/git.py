@@ -10,17 +10,29 @@ Functions:
     get_rules_payload: Build a rules array for GitHub rulesets
     create_or_update_ruleset: Create or update a repository ruleset
     get_all_rulesets: Retrieve all rulesets for a repository
+    get_github_client: Get a cached authenticated PyGithub client
     get_repo: Get a PyGithub Repository object
+    get_rulesets_index: Map ruleset names to ids for a repository
     ruleset_exists: Check if a ruleset with a given name exists
     github_api_request: Make a generic GitHub API request
+    github_api_request_with_headers: API request exposing response headers
+    get_token_remaining_rate_limit: Last known remaining rate limit of a token
     get_github_repo_token: Retrieve GitHub token from environment or .env
+    get_github_repo_tokens: Retrieve a token pool for rate limit rotation
+    get_gitignore_spec: Compile gitignore patterns into a cached GitIgnoreSpec
+    gitignore_spec_matches: Cached match of a posix path against patterns
     path_is_in_gitignore_lines: Check if a path matches gitignore patterns
-    load_gitignore: Load gitignore file as a list of patterns
+    paths_in_gitignore_lines: Batch-match many paths against gitignore patterns
+    as_gitignore_key: Get gitignore lines as the tuple the spec caches use
+    load_gitignore: Load gitignore file as a tuple of patterns
 
 Module Attributes:
     DEFAULT_BRANCH (str): Default branch name ("main")
     DEFAULT_RULESET_NAME (str): Default protection ruleset name
     GITIGNORE_PATH (Path): Path to .gitignore file
+    POOLED_MAX_RATE_LIMIT_WAIT (float): Rate limit wait of token pool clients
+    RULESETS_CACHE_TTL_SECONDS (float): How long fetched rulesets are reused
+    RULE_TYPES (tuple[str, ...]): Ruleset rule types in payload order
 
 Examples:
     Create a ruleset with pull request requirements::
@@ -41,13 +53,23 @@ See Also:
 """
 
 import logging
+import math
 import os
+import posixpath
+import time
+from collections.abc import Iterable, Sequence
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any, Literal
 
 import pathspec
 from dotenv import dotenv_values
-from github import Github
+from github import (
+    Github,
+    GithubRetry,
+    RateLimitExceededExceedsMaxWait,
+    RateLimitExceededException,
+)
 from github.Auth import Token
 from github.Repository import Repository
 
@@ -59,6 +81,59 @@ DEFAULT_RULESET_NAME = f"{DEFAULT_BRANCH}-protection"
 
 GITIGNORE_PATH = Path(".gitignore")
 
+POOLED_MAX_RATE_LIMIT_WAIT = 0.0
+
+RULESETS_CACHE_TTL_SECONDS = 60.0
+
+# Fields of a ruleset as returned by the rulesets listing endpoint, write
+# responses carry the full ruleset and are projected onto these when cached
+RULESET_SUMMARY_KEYS = (
+    "id",
+    "name",
+    "target",
+    "source_type",
+    "source",
+    "enforcement",
+    "node_id",
+    "_links",
+    "created_at",
+    "updated_at",
+)
+
+# rule types accepted by get_rules_payload, in payload order
+RULE_TYPES = (
+    "creation",
+    "update",
+    "deletion",
+    "required_linear_history",
+    "merge_queue",
+    "required_deployments",
+    "required_signatures",
+    "pull_request",
+    "required_status_checks",
+    "non_fast_forward",
+    "commit_message_pattern",
+    "commit_author_email_pattern",
+    "committer_email_pattern",
+    "branch_name_pattern",
+    "tag_name_pattern",
+    "file_path_restriction",
+    "max_file_path_length",
+    "file_extension_restriction",
+    "max_file_size",
+    "workflows",
+    "code_scanning",
+    "copilot_code_review",
+)
+
+# (owner, repo_name) -> (fetched_at, rulesets, etag), shared by sequential writes
+_rulesets_cache: dict[tuple[str, str], tuple[float, list[dict[str, Any]], str]] = {}
+
+# (owner, repo_name) -> (rulesets listing, name -> id index built from it)
+_rulesets_index_cache: dict[
+    tuple[str, str], tuple[list[dict[str, Any]], dict[str, int]]
+] = {}
+
 
 def get_rules_payload(  # noqa: PLR0913
     *,
@@ -143,34 +218,11 @@ def get_rules_payload(  # noqa: PLR0913
             ...     pull_request={"required_approving_review_count": 2}
             ... )
     """
+    # capture the keyword arguments before any other local is bound
+    rule_args = locals()
     rules: list[dict[str, Any]] = []
-
-    rule_map = {
-        "creation": creation,
-        "update": update,
-        "deletion": deletion,
-        "required_linear_history": required_linear_history,
-        "merge_queue": merge_queue,
-        "required_deployments": required_deployments,
-        "required_signatures": required_signatures,
-        "pull_request": pull_request,
-        "required_status_checks": required_status_checks,
-        "non_fast_forward": non_fast_forward,
-        "commit_message_pattern": commit_message_pattern,
-        "commit_author_email_pattern": commit_author_email_pattern,
-        "committer_email_pattern": committer_email_pattern,
-        "branch_name_pattern": branch_name_pattern,
-        "tag_name_pattern": tag_name_pattern,
-        "file_path_restriction": file_path_restriction,
-        "max_file_path_length": max_file_path_length,
-        "file_extension_restriction": file_extension_restriction,
-        "max_file_size": max_file_size,
-        "workflows": workflows,
-        "code_scanning": code_scanning,
-        "copilot_code_review": copilot_code_review,
-    }
-
-    for rule_type, rule_config in rule_map.items():
+    for rule_type in RULE_TYPES:
+        rule_config = rule_args[rule_type]
         if rule_config is not None:
             rule_obj: dict[str, Any] = {"type": rule_type}
             if rule_config:  # If there are parameters
@@ -181,15 +233,18 @@ def get_rules_payload(  # noqa: PLR0913
 
 
 def create_or_update_ruleset(
-    token: str, owner: str, repo_name: str, **ruleset_params: Any
+    token: str | Sequence[str], owner: str, repo_name: str, **ruleset_params: Any
 ) -> Any:
     """Create or update a GitHub repository ruleset.
 
     Checks if a ruleset with the specified name exists. If yes, updates it;
     otherwise, creates a new one. Handles idempotent creation/update pattern.
+    The cached ruleset listing is updated in place with the listing fields of
+    the response, so sequential writes need only one listing request.
 
     Args:
-        token: GitHub API token with repo administration permissions (repo scope).
+        token: GitHub API token, or token pool, with repo administration
+            permissions (repo scope).
         owner: Repository owner username or organization name.
         repo_name: Repository name (without owner prefix).
         **ruleset_params: Ruleset configuration for GitHub API. Must include "name".
@@ -236,6 +291,15 @@ def create_or_update_ruleset(
         method="PUT" if ruleset_id else "POST",
         payload=ruleset_params,
     )
+    cached = _rulesets_cache.get((owner, repo_name))
+    if cached is not None:
+        rulesets = [rs for rs in cached[1] if rs["id"] != ruleset_id]
+        # same shape as the listing entries, not the full written ruleset
+        rulesets.append(
+            {key: result[key] for key in RULESET_SUMMARY_KEYS if key in result}
+        )
+        # keep the old etag, the server listing changed so it revalidates as 200
+        _rulesets_cache[owner, repo_name] = (cached[0], rulesets, cached[2])
     logger.info(
         "Ruleset '%s' %s successfully",
         ruleset_name,
@@ -244,13 +308,16 @@ def create_or_update_ruleset(
     return result
 
 
-def get_all_rulesets(token: str, owner: str, repo_name: str) -> Any:
+def get_all_rulesets(token: str | Sequence[str], owner: str, repo_name: str) -> Any:
     """Retrieve all rulesets defined for a repository.
 
     Fetches all repository rulesets regardless of target or enforcement level.
+    Results are cached per (owner, repo_name) for RULESETS_CACHE_TTL_SECONDS.
+    After that the listing is revalidated with its ETag, so an unchanged
+    listing costs a 304 response instead of a full download.
 
     Args:
-        token: GitHub API token with repository read permissions.
+        token: GitHub API token, or token pool, with repository read permissions.
         owner: Repository owner username or organization name.
         repo_name: Repository name (without owner prefix).
 
@@ -270,15 +337,60 @@ def get_all_rulesets(token: str, owner: str, repo_name: str) -> Any:
             >>> for rs in rulesets:
             ...     print(f"{rs['name']}: {rs['enforcement']}")
     """
-    return github_api_request(
-        token, owner, repo_name, endpoint="rulesets", method="GET"
+    now = time.monotonic()
+    cached = _rulesets_cache.get((owner, repo_name))
+    if cached is not None and now - cached[0] < RULESETS_CACHE_TTL_SECONDS:
+        return cached[1]
+    etag = cached[2] if cached is not None else ""
+    response_headers, rulesets = github_api_request_with_headers(
+        token,
+        owner,
+        repo_name,
+        endpoint="rulesets",
+        method="GET",
+        headers={"If-None-Match": etag} if etag else None,
+    )
+    if cached is not None and rulesets is None:
+        # 304 Not Modified, does not count against the primary rate limit
+        rulesets = cached[1]
+    _rulesets_cache[owner, repo_name] = (
+        now,
+        rulesets,
+        response_headers.get("etag", ""),
     )
+    return rulesets
 
 
+@cache
+def get_github_client(
+    token: str, *, max_rate_limit_wait: float | None = None
+) -> Github:
+    """Get an authenticated PyGithub client.
+
+    Cached per token and wait limit so all API calls share one client and its
+    connection pool instead of paying a new TLS handshake per request.
+
+    Args:
+        token: GitHub API token for authentication.
+        max_rate_limit_wait: Most seconds to sleep for a rate limit reset
+            before raising RateLimitExceededExceedsMaxWait. None waits for
+            the reset, however long, like PyGithub's default.
+
+    Returns:
+        github.Github client authenticated with the token.
+    """
+    return Github(
+        auth=Token(token), retry=GithubRetry(max_rate_limit_wait=max_rate_limit_wait)
+    )
+
+
+@lru_cache(maxsize=32)
 def get_repo(token: str, owner: str, repo_name: str) -> Repository:
     """Get a PyGithub Repository object for API operations.
 
-    Creates an authenticated PyGithub client and retrieves a Repository object.
+    Retrieves a Repository object through the cached authenticated client.
+    Cached per (token, owner, repo_name), so repeated API calls against the
+    same repository skip the repository lookup request.
 
     Args:
         token: GitHub API token for authentication.
@@ -299,18 +411,43 @@ def get_repo(token: str, owner: str, repo_name: str) -> Repository:
             >>> print(repo.full_name)
             'myorg/myrepo'
     """
-    auth = Token(token)
-    github = Github(auth=auth)
-    return github.get_repo(f"{owner}/{repo_name}")
+    return get_github_client(token).get_repo(f"{owner}/{repo_name}")
+
+
+def get_rulesets_index(
+    token: str | Sequence[str], owner: str, repo_name: str
+) -> dict[str, int]:
+    """Get a name to id index of all rulesets in a repository.
+
+    The index is built once per fetched ruleset listing and rebuilt only when
+    get_all_rulesets returns a different listing, so repeated lookups are
+    dict hits instead of linear scans.
+
+    Args:
+        token: GitHub API token, or token pool, with repository read permissions.
+        owner: Repository owner username or organization name.
+        repo_name: Repository name (without owner prefix).
+
+    Returns:
+        Mapping of ruleset name to ruleset ID.
+    """
+    rulesets = get_all_rulesets(token, owner, repo_name)
+    cached = _rulesets_index_cache.get((owner, repo_name))
+    if cached is None or cached[0] is not rulesets:
+        cached = (rulesets, {rs["name"]: rs["id"] for rs in rulesets})
+        _rulesets_index_cache[owner, repo_name] = cached
+    return cached[1]
 
 
-def ruleset_exists(token: str, owner: str, repo_name: str, ruleset_name: str) -> int:
+def ruleset_exists(
+    token: str | Sequence[str], owner: str, repo_name: str, ruleset_name: str
+) -> int:
     """Check if a ruleset with the given name exists in a repository.
 
-    Searches all rulesets to find one matching the specified name.
+    Looks the name up in the cached ruleset index.
 
     Args:
-        token: GitHub API token with repository read permissions.
+        token: GitHub API token, or token pool, with repository read permissions.
         owner: Repository owner username or organization name.
         repo_name: Repository name (without owner prefix).
         ruleset_name: Name of the ruleset (case-sensitive exact match).
@@ -334,13 +471,11 @@ def ruleset_exists(token: str, owner: str, repo_name: str, ruleset_name: str) ->
     Note:
         Returns 0 (falsy) when not found, convenient for boolean checks.
     """
-    rulesets = get_all_rulesets(token, owner, repo_name)
-    main_ruleset = next((rs for rs in rulesets if rs["name"] == ruleset_name), None)
-    return main_ruleset["id"] if main_ruleset else 0
+    return get_rulesets_index(token, owner, repo_name).get(ruleset_name, 0)
 
 
 def github_api_request(  # noqa: PLR0913
-    token: str,
+    token: str | Sequence[str],
     owner: str,
     repo_name: str,
     endpoint: str,
@@ -350,11 +485,13 @@ def github_api_request(  # noqa: PLR0913
 ) -> Any:
     """Make a generic GitHub API request for a repository.
 
-    Performs an authenticated HTTP request using PyGithub's internal requester.
+    Performs an authenticated HTTP request using PyGithub's requester.
     Provides low-level interface for endpoints not fully supported by PyGithub.
+    With several tokens, the one with the most remaining rate limit is tried
+    first and the next one is used when a token hits its rate limit.
 
     Args:
-        token: GitHub API token for authentication.
+        token: GitHub API token, or a pool of tokens, for authentication.
         owner: Repository owner username or organization name.
         repo_name: Repository name (without owner prefix).
         endpoint: API endpoint path relative to repository URL (e.g., "rulesets",
@@ -367,6 +504,7 @@ def github_api_request(  # noqa: PLR0913
 
     Raises:
         github.GithubException: If API request fails.
+        github.RateLimitExceededException: If every token is rate limited.
 
     Examples:
         Get all rulesets::
@@ -377,27 +515,102 @@ def github_api_request(  # noqa: PLR0913
             ... )
 
     Note:
-        Uses PyGithub's internal `_requester` with automatic API version header.
+        Sends the request through the cached client's requester on a relative
+        repository URL, so no Repository object is fetched or constructed.
     """
-    logger.debug("GitHub API request: %s %s/%s/%s", method, owner, repo_name, endpoint)
-    repo = get_repo(token, owner, repo_name)
-    url = f"{repo.url}/{endpoint}"
+    _headers, res = github_api_request_with_headers(
+        token, owner, repo_name, endpoint, method=method, payload=payload
+    )
+    return res
+
+
+def github_api_request_with_headers(  # noqa: PLR0913
+    token: str | Sequence[str],
+    owner: str,
+    repo_name: str,
+    endpoint: str,
+    *,
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"] = "GET",
+    payload: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+) -> tuple[dict[str, Any], Any]:
+    """Make a GitHub API request and also return the response headers.
+
+    Same as github_api_request, but allows extra request headers such as
+    ``If-None-Match`` and exposes response headers such as ``etag``.
 
-    headers = {
+    Args:
+        token: GitHub API token, or a pool of tokens, for authentication.
+        owner: Repository owner username or organization name.
+        repo_name: Repository name (without owner prefix).
+        endpoint: API endpoint path relative to repository URL. Do not include
+            leading slash.
+        method: HTTP method. Defaults to "GET".
+        payload: Optional dict to send as JSON. Used for POST, PUT, PATCH.
+        headers: Optional extra request headers.
+
+    Returns:
+        Tuple of response headers and parsed JSON response. The response is
+        None for empty bodies, e.g. a 304 Not Modified.
+
+    Raises:
+        github.GithubException: If API request fails.
+        github.RateLimitExceededException: If every token is rate limited.
+    """
+    logger.debug("GitHub API request: %s %s/%s/%s", method, owner, repo_name, endpoint)
+    tokens = [token] if isinstance(token, str) else list(token)
+    # a pooled client raises on a rate limit instead of sleeping until the
+    # reset, so the next token is tried right away
+    max_wait = None
+    if len(tokens) > 1:
+        max_wait = POOLED_MAX_RATE_LIMIT_WAIT
+        tokens.sort(key=get_token_remaining_rate_limit, reverse=True)
+
+    request_headers = {
         "Accept": "application/vnd.github+json",
         "X-GitHub-Api-Version": "2022-11-28",
+        **(headers or {}),
     }
 
-    _headers, res = repo._requester.requestJsonAndCheck(  # noqa: SLF001
-        method,
-        url,
-        headers=headers,
-        input=payload,
-    )
-    logger.debug("GitHub API request successful: %s %s", method, endpoint)
-    return res
+    for i, pool_token in enumerate(tokens, start=1):
+        try:
+            client = get_github_client(pool_token, max_rate_limit_wait=max_wait)
+            requester = client.requester
+            response_headers, res = requester.requestJsonAndCheck(
+                method,
+                f"/repos/{owner}/{repo_name}/{endpoint}",
+                headers=request_headers,
+                input=payload,
+            )
+        except (RateLimitExceededException, RateLimitExceededExceedsMaxWait):
+            if i == len(tokens):
+                raise
+            logger.warning("Token %d/%d rate limited, trying next", i, len(tokens))
+            continue
+        logger.debug("GitHub API request successful: %s %s", method, endpoint)
+        return response_headers, res
+    msg = "Expected at least one token"
+    raise ValueError(msg)
+
+
+def get_token_remaining_rate_limit(token: str) -> float:
+    """Get the remaining API rate limit last reported for a token.
+
+    Reads the value PyGithub tracked from the latest response headers of the
+    cached token pool client, so no request is made.
+
+    Args:
+        token: GitHub API token.
+
+    Returns:
+        Remaining requests, or infinity if no response has been seen yet.
+    """
+    client = get_github_client(token, max_rate_limit_wait=POOLED_MAX_RATE_LIMIT_WAIT)
+    remaining, _limit = client.requester.rate_limiting
+    return math.inf if remaining < 0 else remaining
 
 
+@cache
 def get_github_repo_token() -> str:
     """Retrieve the GitHub repository token for API authentication.
 
@@ -418,7 +631,8 @@ def get_github_repo_token() -> str:
             'ghp_...'
 
     Note:
-        For ruleset management, token needs `repo` scope.
+        For ruleset management, token needs `repo` scope. The token is cached
+        for the process lifetime, so .env is parsed at most once.
 
     Security:
         Never commit tokens. Use environment variables or .env (gitignored).
@@ -444,44 +658,158 @@ def get_github_repo_token() -> str:
     raise ValueError(msg)
 
 
+@cache
+def get_github_repo_tokens() -> tuple[str, ...]:
+    """Retrieve a pool of GitHub tokens for API authentication.
+
+    Reads comma-separated tokens from the REPO_TOKENS environment variable,
+    falling back to the single token from get_github_repo_token. Pass the pool
+    to github_api_request to spread requests over several rate limits.
+
+    Returns:
+        Tuple of one or more GitHub API tokens.
+
+    Raises:
+        ValueError: If neither REPO_TOKENS nor REPO_TOKEN is available.
+    """
+    tokens = tuple(
+        t.strip() for t in os.getenv("REPO_TOKENS", "").split(",") if t.strip()
+    )
+    if tokens:
+        logger.debug("Using %d tokens from REPO_TOKENS", len(tokens))
+        return tokens
+    return (get_github_repo_token(),)
+
+
+@lru_cache(maxsize=32)
+def get_gitignore_spec(gitignore_lines: tuple[str, ...]) -> pathspec.GitIgnoreSpec:
+    """Compile gitignore pattern lines into a GitIgnoreSpec.
+
+    Cached by the pattern lines themselves, so repeated checks against the same
+    gitignore reuse one compiled spec and any edit to the lines compiles anew.
+    The cache is bounded, specs of old gitignore contents age out.
+
+    Args:
+        gitignore_lines: Gitignore pattern strings as a hashable tuple.
+
+    Returns:
+        Compiled spec following Git's own gitignore semantics.
+    """
+    return pathspec.GitIgnoreSpec.from_lines(gitignore_lines)
+
+
+@lru_cache(maxsize=10_000)
+def gitignore_spec_matches(gitignore_lines: tuple[str, ...], posix_path: str) -> bool:
+    """Check a normalized posix path against gitignore patterns.
+
+    Results are memoized per (patterns, path) pair, so the same path checked
+    repeatedly during tree walks is a hash lookup instead of a pattern match.
+    Keying on the patterns means edited gitignore content never hits stale
+    entries; those simply age out of the bounded cache.
+
+    Args:
+        gitignore_lines: Gitignore pattern strings as a hashable tuple.
+        posix_path: Relative posix path, with a trailing slash for directories.
+
+    Returns:
+        True if the path matches the patterns and would be ignored by Git.
+    """
+    return get_gitignore_spec(gitignore_lines).match_file(posix_path)
+
+
 def path_is_in_gitignore_lines(
-    gitignore_lines: list[str], relative_path: str | Path
+    gitignore_lines: Sequence[str],
+    relative_path: str | Path,
+    *,
+    is_dir: bool | None = None,
 ) -> bool:
     """Check if a path matches any pattern in a list of gitignore lines.
 
     Args:
-        gitignore_lines: List of gitignore pattern strings.
+        gitignore_lines: Gitignore pattern strings. Pass the tuple returned by
+            load_gitignore to reuse it as cache key, other sequences are
+            copied into a tuple on every call.
         relative_path: Path to check (string or Path). Absolute paths converted
             to relative. Directories can have optional trailing slash.
+        is_dir: Whether the path is a directory, if the caller already knows.
+            Skips the filesystem stat call. If None, a trailing slash marks a
+            directory without touching the filesystem, otherwise one stat
+            decides: a suffixless path is a directory unless it is an existing
+            file, a path with a suffix only if it is an existing directory.
 
     Returns:
         True if path matches any pattern and would be ignored by Git.
 
     See Also:
         load_gitignore: Load patterns from .gitignore file.
+        gitignore_spec_matches: Cached pattern matching.
     """
-    as_path = Path(relative_path)
-    if as_path.is_absolute():
-        as_path = as_path.relative_to(Path.cwd())
-    is_dir = (
-        bool(as_path.suffix == "") or as_path.is_dir() or str(as_path).endswith(os.sep)
-    )
-    is_dir = is_dir and not as_path.is_file()
-
-    as_posix = as_path.as_posix()
-    if is_dir and not as_posix.endswith("/"):
+    if isinstance(relative_path, str) and not os.path.isabs(relative_path):  # noqa: PTH117
+        # fast path for the common relative string, no Path objects involved
+        path_str = relative_path
+    else:
+        as_path = Path(relative_path)
+        if as_path.is_absolute():
+            as_path = as_path.relative_to(Path.cwd())
+        path_str = str(as_path)
+    # normalize once to "/" semantics, a trailing slash marks a directory
+    as_posix = path_str.replace(os.sep, "/")
+    if is_dir is None:
+        if as_posix.endswith("/"):
+            is_dir = True
+        elif os.path.splitext(path_str)[1] == "":  # noqa: PTH122
+            is_dir = not os.path.isfile(path_str)  # noqa: PTH113
+        else:
+            is_dir = os.path.isdir(path_str)  # noqa: PTH112
+    as_posix = posixpath.normpath(as_posix)
+    if is_dir:
         as_posix += "/"
 
-    spec = pathspec.PathSpec.from_lines(
-        "gitwildmatch",
-        gitignore_lines,
-    )
+    return gitignore_spec_matches(as_gitignore_key(gitignore_lines), as_posix)
+
+
+def paths_in_gitignore_lines(
+    gitignore_lines: Sequence[str], posix_paths: Iterable[str]
+) -> set[str]:
+    """Find all paths that match a list of gitignore lines in one batch.
+
+    Runs the cached spec over all paths at once with ``match_files`` instead
+    of one Python-level check per path.
 
-    return spec.match_file(as_posix)
+    Args:
+        gitignore_lines: Gitignore pattern strings, ideally the tuple returned
+            by load_gitignore.
+        posix_paths: Relative posix paths. Directories need a trailing slash.
+
+    Returns:
+        Set of the given paths that would be ignored by Git.
+
+    See Also:
+        path_is_in_gitignore_lines: Single-path check with path normalization.
+    """
+    spec = get_gitignore_spec(as_gitignore_key(gitignore_lines))
+    return set(spec.match_files(posix_paths))
+
+
+def as_gitignore_key(gitignore_lines: Sequence[str]) -> tuple[str, ...]:
+    """Get gitignore lines as the tuple the spec caches are keyed on.
+
+    Tuples are passed through unchanged, so a tuple from load_gitignore is
+    built once and reused as key instead of being copied on every check.
+
+    Args:
+        gitignore_lines: Gitignore pattern strings.
+
+    Returns:
+        The lines as a tuple.
+    """
+    if isinstance(gitignore_lines, tuple):
+        return gitignore_lines
+    return tuple(gitignore_lines)
 
 
-def load_gitignore(path: Path = GITIGNORE_PATH) -> list[str]:
-    """Load a gitignore file as a list of pattern strings.
+def load_gitignore(path: Path = GITIGNORE_PATH) -> tuple[str, ...]:
+    """Load a gitignore file as a tuple of pattern strings.
 
     Reads gitignore file and splits into lines. Preserves empty lines and comments
     for use with pathspec.PathSpec.
@@ -490,7 +818,8 @@ def load_gitignore(path: Path = GITIGNORE_PATH) -> list[str]:
         path: Path to gitignore file. Defaults to GITIGNORE_PATH (".gitignore").
 
     Returns:
-        List of strings, one per line. Includes empty lines and comments.
+        Tuple of strings, one per line. Includes empty lines and comments.
+        Being hashable, it is used as is as key of the spec caches.
 
     Raises:
         FileNotFoundError: If gitignore file doesn't exist.
@@ -501,13 +830,17 @@ def load_gitignore(path: Path = GITIGNORE_PATH) -> list[str]:
 
             >>> patterns = load_gitignore()
             >>> print(patterns[:3])
-            ['# Byte-compiled / optimized / DLL files', '__pycache__/', '*.py[cod]']
+            ('# Byte-compiled / optimized / DLL files', '__pycache__/', '*.py[cod]')
 
     See Also:
         path_is_in_gitignore_lines: Check if path matches patterns
 
     Note:
         Does not filter or process patterns. Pattern interpretation handled by
-        pathspec library.
+        pathspec library. Uses ``splitlines`` rather than splitting on the
+        newline character on purpose: it drops the trailing empty line and
+        handles CRLF files, which keeps load and dump of GitIgnoreConfigFile
+        round-tripping. Repeated parsing cost is avoided by the cached spec in
+        get_gitignore_spec.
     """
-    return path.read_text(encoding="utf-8").splitlines()
+    return tuple(path.read_text(encoding="utf-8").splitlines())
@@ -6,9 +6,13 @@ Wraps setuptools' package discovery with additional filtering and automatic
 
 Functions:
     find_packages: Discover Python packages with depth and pattern filtering
+    get_package_depth_pattern: Cached regex for the package depth filter
+    load_gitignore_package_excludes: Cached gitignore to package exclude patterns
     get_src_package: Identify and import the main source package
+    get_src_package_name: Cached discovery of the source package name
     src_pkg_is_pyrig: Check if the current project is pyrig itself
     get_namespace_packages: Find all PEP 420 namespace packages
+    is_regular_package: Check if a package chain has __init__.py files
 
 Examples:
     Discover the main source package::
@@ -30,7 +34,10 @@ See Also:
 """
 
 import logging
+import re
+import sys
 from collections.abc import Iterable
+from functools import cache, lru_cache
 from importlib import import_module
 from pathlib import Path
 from types import ModuleType
@@ -39,9 +46,8 @@ from setuptools import find_namespace_packages as _find_namespace_packages
 from setuptools import find_packages as _find_packages
 
 import pyrig
-from pyrig.dev.utils.git import load_gitignore, path_is_in_gitignore_lines
+from pyrig.dev.utils.git import load_gitignore, paths_in_gitignore_lines
 from pyrig.src.modules.package import DOCS_DIR_NAME
-from pyrig.src.modules.path import ModulePath
 from pyrig.src.testing.convention import TESTS_PACKAGE_NAME
 
 logger = logging.getLogger(__name__)
@@ -71,7 +77,8 @@ def find_packages(
         where: Root directory to search. Defaults to current directory (".").
         exclude: Glob patterns for package names to exclude. If None, automatically
             reads .gitignore and converts directory patterns to package patterns
-            (e.g., "build/" becomes "build").
+            (e.g., "build/" becomes "build" and "build.*"), so ignored directories
+            are neither returned nor descended into.
         include: Glob patterns for package names to include. Defaults to all ("*").
 
     Returns:
@@ -94,16 +101,19 @@ def find_packages(
             >>> find_packages(exclude=['tests*'])
             ['myproject', 'myproject.utils']
     """
-    gitignore_path = Path(".gitignore")
     if exclude is None:
-        exclude = (
-            gitignore_path.read_text(encoding="utf-8").splitlines()
-            if gitignore_path.exists()
-            else []
-        )
-        exclude = [
-            p.replace("/", ".").removesuffix(".") for p in exclude if p.endswith("/")
-        ]
+        gitignore_path = Path(".gitignore")
+        # one stat covers both the existence check and the cache key
+        try:
+            mtime_ns = gitignore_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            exclude = []
+        else:
+            exclude = list(
+                load_gitignore_package_excludes(
+                    str(gitignore_path.absolute()), mtime_ns
+                )
+            )
     if include_namespace_packages:
         package_names = _find_namespace_packages(
             where=where, exclude=exclude, include=include
@@ -111,13 +121,52 @@ def find_packages(
     else:
         package_names = _find_packages(where=where, exclude=exclude, include=include)
 
-    # Convert to list of strings explicitly
-    package_names_list: list[str] = list(map(str, package_names))
+    # setuptools already returns a fresh list of strings
+    if depth is None:
+        return package_names
+    return list(filter(get_package_depth_pattern(depth).fullmatch, package_names))
+
+
+@lru_cache
+def get_package_depth_pattern(depth: int) -> re.Pattern[str]:
+    """Compile a regex matching package names up to the given nesting depth.
+
+    Args:
+        depth: Maximum number of dots in a matching package name.
+
+    Returns:
+        Compiled pattern, cached per depth, for filtering package name lists.
+    """
+    return re.compile(rf"[^.]+(?:\.[^.]+){{0,{depth}}}")
 
-    if depth is not None:
-        package_names_list = [p for p in package_names_list if p.count(".") <= depth]
 
-    return package_names_list
+@lru_cache(maxsize=8)
+def load_gitignore_package_excludes(path: str, mtime_ns: int) -> tuple[str, ...]:  # noqa: ARG001
+    """Convert the directory patterns of a gitignore file to package excludes.
+
+    Each "dir/" pattern becomes "dir" plus "dir.*", so setuptools neither returns
+    nor descends into ignored directories. Comments and negated patterns are
+    skipped. Cached per path and modification time, so repeated discovery
+    parses the file once and still sees edits.
+
+    Args:
+        path: Absolute path to the gitignore file.
+        mtime_ns: Modification time of the file, only used as cache key.
+
+    Returns:
+        Package exclude patterns in gitignore order.
+    """
+    # unbuffered, the whole file is read at once anyway
+    with Path(path).open("rb", buffering=0) as f:
+        lines = f.read().decode("utf-8").splitlines()
+    # comments and negations are not directories to exclude
+    names = (
+        line[:-1].replace("/", ".")
+        for line in lines
+        if line.endswith("/") and not line.startswith(("#", "!"))
+    )
+    # "name.*" makes setuptools prune the ignored subtree instead of walking it
+    return tuple(pattern for p in names for pattern in (p, f"{p}.*"))
 
 
 def get_src_package() -> ModuleType:
@@ -150,26 +199,53 @@ def get_src_package() -> ModuleType:
 
     Note:
         Only considers regular packages (with __init__.py), not namespace packages.
+        The discovered name is cached per working directory, see
+        get_src_package_name.
+    """
+    pkg_name = get_src_package_name(Path.cwd())
+    # already imported in the common case, skip the import machinery
+    return sys.modules.get(pkg_name) or import_module(pkg_name)
+
+
+@cache
+def get_src_package_name(cwd: Path) -> str:  # noqa: ARG001
+    """Discover the name of the main source package in the current directory.
+
+    The source package of a project does not change while the process runs, so
+    the top-level package walk happens once per working directory. Failures
+    are not cached. Use get_src_package_name.cache_clear() after renaming the
+    source package in place.
+
+    Args:
+        cwd: Current working directory, only used as cache key.
+
+    Returns:
+        Name of the single non-test top-level package.
+
+    Raises:
+        ModuleNotFoundError: If the source package cannot be reliably determined
+            (zero or multiple non-test top-level packages).
     """
     logger.debug("Discovering top-level source package")
     package_names = find_packages(depth=0, include_namespace_packages=False)
-    package_paths = [ModulePath.pkg_name_to_relative_dir_path(p) for p in package_names]
-    pkgs = [p for p in package_paths if p.name not in {TESTS_PACKAGE_NAME}]
-    if len(pkgs) != 1:
+    # top-level names have no dots, so they are the directory names already
+    pkg_names = [p for p in package_names if p != TESTS_PACKAGE_NAME]
+    if len(pkg_names) != 1:
         msg = "Could not reliably determine source package."
         raise ModuleNotFoundError(msg)
-    pkg = pkgs[0]
-    pkg_name = pkg.name
+    pkg_name = pkg_names[0]
     logger.debug("Identified source package: %s", pkg_name)
 
-    return import_module(pkg_name)
+    return pkg_name
 
 
 def src_pkg_is_pyrig() -> bool:
     """Check if the current project is pyrig itself.
 
     Determines whether the current working directory is the pyrig project by
-    checking if "pyrig" is among the top-level packages.
+    checking if "pyrig" is among the top-level packages. Without a
+    pyrig/__init__.py in the current directory this returns False right away,
+    skipping the package discovery walk.
 
     Returns:
         True if "pyrig" is a top-level package in the current directory.
@@ -183,6 +259,9 @@ def src_pkg_is_pyrig() -> bool:
     Note:
         Detects the pyrig repository, not pyrig as an installed dependency.
     """
+    # find_packages only returns directories with an __init__.py
+    if not Path(pyrig.__name__, "__init__.py").is_file():
+        return False
     pkgs = find_packages(depth=0, include_namespace_packages=False)
     return pyrig.__name__ in pkgs
 
@@ -190,9 +269,9 @@ def src_pkg_is_pyrig() -> bool:
 def get_namespace_packages() -> list[str]:
     """Find all PEP 420 namespace packages in the project.
 
-    Discovers namespace packages (packages without `__init__.py`) by comparing
-    results from find_namespace_packages with find_packages. Automatically excludes
-    docs directory and .gitignore patterns.
+    Discovers namespace packages (packages without `__init__.py`) with a single
+    find_namespace_packages walk, keeping the packages that are not regular
+    packages. Automatically excludes docs directory and .gitignore patterns.
 
     Returns:
         List of namespace package names as dot-separated strings. Empty list if
@@ -209,18 +288,37 @@ def get_namespace_packages() -> list[str]:
         PEP 420: Implicit Namespace Packages
     """
     logger.debug("Discovering namespace packages")
-    packages = find_packages(depth=None)
-    namespace_packages = find_packages(depth=None, include_namespace_packages=True)
-    namespace_packages = [
-        p for p in namespace_packages if not p.startswith(DOCS_DIR_NAME)
-    ]
-    # exclude all that are in .gitignore
-    gitignore_lines = load_gitignore()
+    # one namespace-aware walk, regular packages are told apart by their inits
     namespace_packages = [
         p
-        for p in namespace_packages
-        if not path_is_in_gitignore_lines(gitignore_lines, p)
+        for p in find_packages(depth=None, include_namespace_packages=True)
+        if not p.startswith(DOCS_DIR_NAME) and not is_regular_package(p)
     ]
-    result = list(set(namespace_packages) - set(packages))
+    # exclude all that are in .gitignore
+    ignored = paths_in_gitignore_lines(
+        load_gitignore(), (f"{p}/" for p in namespace_packages)
+    )
+    result = [p for p in namespace_packages if f"{p}/" not in ignored]
     logger.debug("Found %d namespace packages: %s", len(result), result)
     return result
+
+
+def is_regular_package(package_name: str, where: str = ".") -> bool:
+    """Check if a package and all its parents have an ``__init__.py``.
+
+    Mirrors what setuptools' ``find_packages`` accepts as a regular package,
+    without walking the tree: it only descends into directories that have an
+    ``__init__.py``.
+
+    Args:
+        package_name: Dot-separated package name.
+        where: Root directory the package name is relative to.
+
+    Returns:
+        True if every package level has an ``__init__.py`` file.
+    """
+    parts = package_name.split(".")
+    return all(
+        Path(where, *parts[:i], "__init__.py").is_file()
+        for i in range(1, len(parts) + 1)
+    )
@@ -4,12 +4,15 @@ Decorators that enable graceful fallback to local resource files when network
 operations fail. Useful for fetching remote configuration with cached local copies
 for offline operation.
 
-Uses tenacity for exception handling and integrates with pyrig's resource system.
+Catches the exceptions with a plain try/except, or with tenacity when extra
+tenacity arguments are given, and integrates with pyrig's resource system.
 In pyrig development mode, automatically updates resource files with successful
 fetch results to keep fallback content fresh.
 
 Functions:
     return_resource_file_content_on_exceptions: Generic fallback decorator
+    wrap_with_resource_fallback: Catch exceptions once and return resource content
+    read_resource_content: Cached read of a resource file
     return_resource_content_on_fetch_error: HTTP request error fallback decorator
 
 Examples:
@@ -30,7 +33,8 @@ Note:
 """
 
 from collections.abc import Callable
-from functools import wraps
+from functools import cache, wraps
+from pathlib import Path
 from typing import Any, ParamSpec
 
 from requests import RequestException
@@ -57,11 +61,13 @@ def return_resource_file_content_on_exceptions(
     returns resource file content instead. In pyrig development mode, successful
     results are written back to keep resource files fresh.
 
-    Uses tenacity but does not retry - catches exception once and returns fallback.
+    Catches the exception once and returns the fallback, without retrying. Tenacity
+    is only involved when extra tenacity arguments are given.
 
     Args:
         resource_name: Resource file name (without path). E.g., "LATEST_VERSION"
-            refers to `pyrig/resources/LATEST_VERSION`. Must exist.
+            refers to `pyrig/resources/LATEST_VERSION`. Must exist when the
+            fallback is needed; it is not read at decoration time.
         exceptions: Tuple of exception types that trigger fallback. Subclasses
             also trigger fallback.
         overwrite_resource: If True and in pyrig dev mode, write successful results
@@ -86,30 +92,37 @@ def return_resource_file_content_on_exceptions(
 
     Note:
         Strips whitespace from both resource content and function result for
-        consistent formatting. Uses stop_after_attempt(1) - no actual retries.
+        consistent formatting. Never retries: a plain try/except catches the
+        exceptions once, or tenacity with stop_after_attempt(1) when extra
+        tenacity arguments are given.
     """
+    # the resource is read lazily, on the first fallback or comparison
     resource_path = get_resource_path(resource_name, resources)
-    content = resource_path.read_text(encoding="utf-8").strip()
 
     def decorator(func: Callable[P, str]) -> Callable[P, str]:
-        tenacity_decorator = retry(
-            retry=retry_if_exception_type(exception_types=exceptions),
-            stop=stop_after_attempt(
-                max_attempt_number=1
-            ),  # no retries, just catch once
-            retry_error_callback=lambda _state: content,
-            reraise=False,
-            **tenacity_kwargs,
+        decorated_func = wrap_with_resource_fallback(
+            func, resource_path, exceptions, **tenacity_kwargs
         )
 
-        # Apply tenacity decorator to the function once
-        decorated_func = tenacity_decorator(func)
+        if not overwrite_resource:
+            # known at decoration time, no write-back branch needed per call
+            @wraps(func)
+            def read_only_wrapper(*args: P.args, **kwargs: P.kwargs) -> str:
+                return decorated_func(*args, **kwargs).strip()
+
+            return read_only_wrapper
 
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> str:
             result = decorated_func(*args, **kwargs).strip()
-            if src_pkg_is_pyrig() and overwrite_resource and result != content:
-                resource_path.write_text(result, encoding="utf-8")
+            # cheapest check first, src_pkg_is_pyrig may walk the tree
+            if result != read_resource_content(resource_path) and src_pkg_is_pyrig():
+                # write beside the resource and swap it in, an interrupted
+                # write never leaves a truncated resource file behind
+                tmp_path = resource_path.with_name(f"{resource_path.name}.tmp")
+                tmp_path.write_bytes(result.encode("utf-8"))
+                tmp_path.replace(resource_path)
+                read_resource_content.cache_clear()
                 git_add_file(resource_path)
             return result
 
@@ -118,6 +131,66 @@ def return_resource_file_content_on_exceptions(
     return decorator
 
 
+def wrap_with_resource_fallback[**FuncP](
+    func: Callable[FuncP, str],
+    resource_path: Path,
+    exceptions: tuple[type[Exception], ...],
+    **tenacity_kwargs: Any,
+) -> Callable[FuncP, str]:
+    """Wrap a function to return resource content when it raises.
+
+    Args:
+        func: Function returning a string.
+        resource_path: Resource file whose content is the fallback.
+        exceptions: Exception types that trigger the fallback.
+        **tenacity_kwargs: Additional tenacity retry decorator arguments. Without
+            any, a plain try/except is used instead of tenacity.
+
+    Returns:
+        Function with the same signature that catches the exceptions once.
+    """
+    if tenacity_kwargs:
+        tenacity_decorator = retry(
+            retry=retry_if_exception_type(exception_types=exceptions),
+            stop=stop_after_attempt(max_attempt_number=1),  # no retries, catch once
+            retry_error_callback=lambda _state: read_resource_content(resource_path),
+            reraise=False,
+            **tenacity_kwargs,
+        )
+        return tenacity_decorator(func)
+
+    # without extra tenacity arguments a plain try/except is equivalent,
+    # a single exception type is matched directly instead of through a tuple
+    caught = exceptions[0] if len(exceptions) == 1 else exceptions
+
+    def fallback_func(*args: FuncP.args, **kwargs: FuncP.kwargs) -> str:
+        try:
+            return func(*args, **kwargs)
+        except caught:
+            return read_resource_content(resource_path)
+
+    return fallback_func
+
+
+@cache
+def read_resource_content(resource_path: Path) -> str:
+    """Read a resource file once and return its stripped content.
+
+    Decorators referencing the same resource share one read and UTF-8 decode.
+    The cache is cleared whenever a decorator writes a fresh result back.
+
+    Args:
+        resource_path: Path to the resource file.
+
+    Returns:
+        File content with surrounding whitespace stripped.
+
+    Raises:
+        FileNotFoundError: If the resource file does not exist.
+    """
+    return resource_path.read_text(encoding="utf-8").strip()
+
+
 def return_resource_content_on_fetch_error(
     resource_name: str,
 ) -> Callable[[Callable[P, str]], Callable[P, str]]:
@@ -74,7 +74,8 @@ skip_in_github_actions: pytest.MarkDecorator = functools.partial(
 """Skip marker for tests that cannot run in GitHub Actions CI.
 
 Automatically skips tests requiring local resources, interactive input, or
-specific system configurations not available in CI.
+specific system configurations not available in CI. The environment is checked
+once, when this module is imported, so applying the marker costs no lookups.
 
 Type:
     pytest.MarkDecorator
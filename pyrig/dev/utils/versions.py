@@ -5,13 +5,24 @@ to provide convenient methods for extracting version bounds and generating range
 
 VersionConstraint parses PEP 440 specifier strings (e.g., ">=3.8,<3.12") to:
 - Extract inclusive and exclusive lower and upper bounds
-- Generate lists of versions within a constraint
+- Generate tuples of versions within a constraint
 - Adjust version precision (major/minor/micro)
 
 Functions:
     adjust_version_to_level: Truncate version to specific precision level
+    parse_version: Cached parsing of a version string
+    get_release_version: Cached major or major.minor release version
+    bump_micro_version: Cached micro increment of release components
+    get_previous_release_version: Cached inclusive form of an exclusive upper bound
+    get_component_range: Range of a minor or micro component between bounds
+    generate_version_range: Cached version range generation for a specifier
+    parse_version_constraint: Cached parsing of a specifier string and its bounds
+
+Module Attributes:
+    VERSION_LEVEL_INDEXES: Index of the last release component kept per level
 
 Classes:
+    ParsedVersionConstraint: Parse result shared between constraints
     VersionConstraint: Parser and analyzer for PEP 440 version constraints
 
 Examples:
@@ -24,17 +35,22 @@ Examples:
     Generate version range::
 
         >>> vc.get_version_range(level="minor")
-        [<Version('3.8')>, <Version('3.9')>, <Version('3.10')>, <Version('3.11')>]
+        (<Version('3.8')>, <Version('3.9')>, <Version('3.10')>, <Version('3.11')>)
 
 See Also:
     packaging.specifiers: PEP 440 version specifier implementation
 """
 
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
 from typing import Literal
 
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
+VERSION_LEVEL_INDEXES: dict[str, int] = {"major": 0, "minor": 1, "micro": 2}
+
 
 def adjust_version_to_level(
     version: Version, level: Literal["major", "minor", "micro"]
@@ -63,12 +79,246 @@ def adjust_version_to_level(
         Pre-release, post-release, dev, and local identifiers always removed.
     """
     if level == "major":
-        return Version(f"{version.major}")
+        return get_release_version(version.major)
     if level == "minor":
-        return Version(f"{version.major}.{version.minor}")
+        return get_release_version(version.major, version.minor)
     return version
 
 
+@lru_cache(maxsize=4096)
+def parse_version(version: str) -> Version:
+    """Parse a version string, cached so equal strings share one Version.
+
+    Version is immutable, and the same few Python release strings are parsed
+    again and again, so the PEP 440 regex parse runs once per string.
+
+    Args:
+        version: PEP 440 version string, e.g. "3.11".
+
+    Returns:
+        Parsed Version, the same object for the same string.
+
+    Examples:
+        >>> parse_version("3.11") is parse_version("3.11")
+        True
+    """
+    return Version(version)
+
+
+@lru_cache(maxsize=2048)
+def get_release_version(major: int, minor: int | None = None) -> Version:
+    """Build a major or major.minor release version, cached per components.
+
+    Keyed on the ints rather than on a Version, as equal versions like "3.8" and
+    "3.8.0" would share a cache entry but print differently.
+
+    Args:
+        major: Major version component.
+        minor: Minor version component. If None, only the major is used.
+
+    Returns:
+        Version "major" or "major.minor".
+
+    Examples:
+        >>> get_release_version(3, 11)
+        <Version('3.11')>
+    """
+    return parse_version(f"{major}" if minor is None else f"{major}.{minor}")
+
+
+@lru_cache(maxsize=8192)
+def bump_micro_version(major: int, minor: int, micro: int) -> Version:
+    """Build the version one micro step above the given release components.
+
+    Bound conversions bump the same few Python releases over and over, so the
+    PEP 440 parse of the formatted string is cached per release.
+
+    Args:
+        major: Major version component.
+        minor: Minor version component.
+        micro: Micro version component to increment.
+
+    Returns:
+        Version "major.minor.(micro + 1)".
+
+    Examples:
+        >>> bump_micro_version(3, 11, 5)
+        <Version('3.11.6')>
+    """
+    return parse_version(f"{major}.{minor}.{micro + 1}")
+
+
+@lru_cache(maxsize=4096)
+def get_previous_release_version(major: int, minor: int, micro: int) -> Version:
+    """Get the highest release below the given exclusive upper bound, cached.
+
+    Decrements the last non-zero component: micro if non-zero, else minor,
+    else major. Turns an exclusive upper bound into an inclusive one.
+
+    Args:
+        major: Major version component of the exclusive bound.
+        minor: Minor version component of the exclusive bound.
+        micro: Micro version component of the exclusive bound.
+
+    Returns:
+        Inclusive upper bound, e.g. 3.12.4 for 3.12.5, 3.11 for 3.12.0 and 3
+        for 4.0.0.
+
+    Examples:
+        >>> get_previous_release_version(3, 12, 0)
+        <Version('3.11')>
+    """
+    if micro != 0:
+        return parse_version(f"{major}.{minor}.{micro - 1}")
+    if minor != 0:
+        return parse_version(f"{major}.{minor - 1}")
+    return parse_version(f"{major - 1}")
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedVersionConstraint:
+    """Parse result shared between VersionConstraint instances of the same spec.
+
+    Frozen, as one instance is cached per spec string and shared. Field names
+    match the VersionConstraint attributes and properties they back.
+
+    Attributes:
+        sset: Parsed SpecifierSet from packaging library.
+        lowers_inclusive: All lower bounds in inclusive form.
+        lowers_exclusive: All lower bounds in exclusive form.
+        lowers_exclusive_to_inclusive: Exclusive lower bounds converted to
+            inclusive by incrementing micro.
+        uppers_inclusive: All upper bounds in inclusive form.
+        uppers_exclusive: All upper bounds in exclusive form.
+        uppers_inclusive_to_exclusive: Inclusive upper bounds converted to
+            exclusive by incrementing micro.
+        lower_inclusive: Effective lower bound (max of all lowers).
+        upper_exclusive: Effective upper bound (min of all uppers).
+        simple_bounds_only: True if the effective bounds and excluded_versions
+            alone decide whether a release version satisfies the spec.
+        excluded_versions: Versions of != specifiers without wildcard.
+    """
+
+    sset: SpecifierSet
+    lowers_inclusive: tuple[Version, ...]
+    lowers_exclusive: tuple[Version, ...]
+    lowers_exclusive_to_inclusive: tuple[Version, ...]
+    uppers_inclusive: tuple[Version, ...]
+    uppers_exclusive: tuple[Version, ...]
+    uppers_inclusive_to_exclusive: tuple[Version, ...]
+    lower_inclusive: Version | None
+    upper_exclusive: Version | None
+    simple_bounds_only: bool
+    excluded_versions: frozenset[Version]
+
+
+@lru_cache(maxsize=4096)
+def parse_version_constraint(spec: str) -> ParsedVersionConstraint:
+    """Parse a specifier string and compute its bounds, cached per string.
+
+    The same constraint strings (e.g. requires-python) are parsed over and over,
+    so the SpecifierSet and all bound conversions are computed once per spec.
+
+    Args:
+        spec: Cleaned PEP 440 specifier string without quotes, e.g. ">=3.8,<3.12".
+
+    Returns:
+        Parsed specifier set with all inclusive and exclusive bounds. Frozen
+        with tuple fields, as the result is shared.
+    """
+    sset = SpecifierSet(spec)
+
+    # one pass over the specifiers, sorted into the four bound kinds
+    lowers_inclusive: list[Version] = []
+    lowers_exclusive: list[Version] = []
+    uppers_inclusive: list[Version] = []
+    uppers_exclusive: list[Version] = []
+    bounds_by_operator = {
+        ">=": lowers_inclusive,
+        ">": lowers_exclusive,
+        "<=": uppers_inclusive,
+        "<": uppers_exclusive,
+    }
+    # only >=, >, <=, < on non pre-releases and != without wildcard, none with
+    # an epoch or local segment, then the effective bounds and excluded
+    # versions decide membership of generated release versions exactly like
+    # the specifier set
+    simple_bounds_only = True
+    excluded_versions: set[Version] = set()
+    for s in sset:
+        if s.operator == "!=" and not s.version.endswith(".*"):
+            # Version equality pads zeros like !=, so 3.10.0 matches !=3.10
+            version = parse_version(s.version)
+            simple_bounds_only = simple_bounds_only and not (
+                version.epoch or version.local
+            )
+            excluded_versions.add(version)
+            continue
+        bounds = bounds_by_operator.get(s.operator)
+        if bounds is None:
+            simple_bounds_only = False
+            continue
+        version = parse_version(s.version)
+        # the micro bump of exclusive and inclusive bounds drops epoch and local
+        simple_bounds_only = simple_bounds_only and not (
+            version.is_prerelease or version.epoch or version.local
+        )
+        bounds.append(version)
+
+    # increment the last number of exclusive, so
+    # >3.4.1 to >=3.4.2; <3.4.0 to <=3.4.1; 3.0.0 to <=3.0.1
+    lowers_exclusive_to_inclusive = [
+        bump_micro_version(v.major, v.minor, v.micro) for v in lowers_exclusive
+    ]
+    lowers_inclusive += lowers_exclusive_to_inclusive
+
+    # increment the last number of inclusive, so
+    # <=3.4.1 to <3.4.2; >=3.4.0 to >3.4.1; 3.0.0 to >3.0.1
+    uppers_inclusive_to_exclusive = [
+        bump_micro_version(v.major, v.minor, v.micro) for v in uppers_inclusive
+    ]
+    uppers_exclusive = uppers_inclusive_to_exclusive + uppers_exclusive
+
+    return ParsedVersionConstraint(
+        sset=sset,
+        lowers_inclusive=tuple(lowers_inclusive),
+        lowers_exclusive=tuple(lowers_exclusive),
+        lowers_exclusive_to_inclusive=tuple(lowers_exclusive_to_inclusive),
+        uppers_inclusive=tuple(uppers_inclusive),
+        uppers_exclusive=tuple(uppers_exclusive),
+        uppers_inclusive_to_exclusive=tuple(uppers_inclusive_to_exclusive),
+        lower_inclusive=max(lowers_inclusive) if lowers_inclusive else None,
+        upper_exclusive=min(uppers_exclusive) if uppers_exclusive else None,
+        simple_bounds_only=simple_bounds_only,
+        excluded_versions=frozenset(excluded_versions),
+    )
+
+
+def get_component_range(lower: int, upper: int) -> range:
+    """Get the range of a minor or micro component between two bounds.
+
+    If the upper component is smaller than the lower one (e.g. 3.12 to 4.1 for
+    the minor), the range starts at 0 and is widened by the difference instead.
+
+    Args:
+        lower: Component of the lower bound.
+        upper: Component of the upper bound.
+
+    Returns:
+        Inclusive range of component values to generate.
+
+    Examples:
+        >>> get_component_range(8, 11)
+        range(8, 12)
+        >>> get_component_range(12, 1)
+        range(0, 24)
+    """
+    diff = upper - lower
+    if diff >= 0:
+        return range(lower, upper + 1)
+    return range(lower + abs(diff) + 1)
+
+
 class VersionConstraint:
     """Parser and analyzer for PEP 440 version constraints.
 
@@ -82,16 +332,18 @@ class VersionConstraint:
         constraint (str): Original constraint string.
         spec (str): Cleaned specifier (quotes/whitespace stripped).
         sset (SpecifierSet): Parsed SpecifierSet from packaging library.
-        lowers_inclusive (list[Version]): All lower bounds in inclusive form.
-        lowers_exclusive (list[Version]): All lower bounds in exclusive form.
-        lowers_exclusive_to_inclusive (list[Version]): Exclusive lower bounds
-            converted to inclusive by incrementing micro.
-        uppers_inclusive (list[Version]): All upper bounds in inclusive form.
-        uppers_exclusive (list[Version]): All upper bounds in exclusive form.
-        uppers_inclusive_to_exclusive (list[Version]): Inclusive upper bounds
-            converted to exclusive by incrementing micro.
+        parsed (ParsedVersionConstraint): Shared parse result of the spec, backs
+            the bound list properties (lowers_inclusive, uppers_exclusive, ...).
         lower_inclusive (Version | None): Effective lower bound (max of all lowers).
         upper_exclusive (Version | None): Effective upper bound (min of all uppers).
+        upper_inclusive (Version | None): Effective upper bound in inclusive form.
+        simple_bounds_only (bool): True if all specifiers are >=, >, <= or < on
+            non pre-release versions or != without wildcard, none with an epoch
+            or local segment, so the effective
+            bounds and excluded_versions alone decide whether a release version
+            satisfies the constraint.
+        excluded_versions (frozenset[Version]): Versions of != specifiers
+            without wildcard.
 
     Examples:
         Parse and extract bounds::
@@ -103,13 +355,26 @@ class VersionConstraint:
         Generate version range::
 
             >>> vc.get_version_range(level="minor")
-            [<Version('3.8')>, <Version('3.9')>, <Version('3.10')>, <Version('3.11')>]
+            (<Version('3.8')>, <Version('3.9')>, <Version('3.10')>, <Version('3.11')>)
 
     Note:
         Assumes non-negative integer version components. Converts bounds by
-        incrementing/decrementing micro version.
+        incrementing/decrementing micro version. Uses __slots__, as many
+        constraints may be created and attributes are read in hot loops.
     """
 
+    __slots__ = (
+        "constraint",
+        "excluded_versions",
+        "lower_inclusive",
+        "parsed",
+        "simple_bounds_only",
+        "spec",
+        "sset",
+        "upper_exclusive",
+        "upper_inclusive",
+    )
+
     def __init__(self, constraint: str) -> None:
         """Initialize a VersionConstraint from a PEP 440 specifier string.
 
@@ -127,46 +392,77 @@ class VersionConstraint:
             3.8
         """
         self.constraint = constraint
-        self.spec = self.constraint.strip().strip('"').strip("'")
-        self.sset = SpecifierSet(self.spec)
-
-        self.lowers_inclusive = [
-            Version(s.version) for s in self.sset if s.operator == ">="
-        ]
-        self.lowers_exclusive = [
-            Version(s.version) for s in self.sset if s.operator == ">"
-        ]
-        # increment the last number of exclusive, so
-        # >3.4.1 to >=3.4.2; <3.4.0 to <=3.4.1; 3.0.0 to <=3.0.1
-        self.lowers_exclusive_to_inclusive = [
-            Version(f"{v.major}.{v.minor}.{v.micro + 1}") for v in self.lowers_exclusive
-        ]
-        self.lowers_inclusive = (
-            self.lowers_inclusive + self.lowers_exclusive_to_inclusive
+        self.spec = self.constraint.strip().strip("\"'")
+        # the bound lists stay in the shared parse result until accessed
+        self.parsed = parse_version_constraint(self.spec)
+        self.sset = self.parsed.sset
+        self.lower_inclusive = self.parsed.lower_inclusive
+        self.upper_exclusive = self.parsed.upper_exclusive
+        self.simple_bounds_only = self.parsed.simple_bounds_only
+        self.excluded_versions = self.parsed.excluded_versions
+
+        upper_exclusive = self.upper_exclusive
+        self.upper_inclusive = (
+            get_previous_release_version(
+                upper_exclusive.major, upper_exclusive.minor, upper_exclusive.micro
+            )
+            if upper_exclusive is not None
+            else None
         )
 
-        self.uppers_inclusive = [
-            Version(s.version) for s in self.sset if s.operator == "<="
-        ]
-        self.uppers_exclusive = [
-            Version(s.version) for s in self.sset if s.operator == "<"
-        ]
-
-        # increment the last number of inclusive, so
-        # <=3.4.1 to <3.4.2; >=3.4.0 to >3.4.1; 3.0.0 to >3.0.1
-        self.uppers_inclusive_to_exclusive = [
-            Version(f"{v.major}.{v.minor}.{v.micro + 1}") for v in self.uppers_inclusive
-        ]
-        self.uppers_exclusive = (
-            self.uppers_inclusive_to_exclusive + self.uppers_exclusive
-        )
+    @property
+    def lowers_inclusive(self) -> list[Version]:
+        """All lower bounds in inclusive form.
 
-        self.upper_exclusive = (
-            min(self.uppers_exclusive) if self.uppers_exclusive else None
-        )
-        self.lower_inclusive = (
-            max(self.lowers_inclusive) if self.lowers_inclusive else None
-        )
+        Returns:
+            New list built from the shared parse result on each access.
+        """
+        return list(self.parsed.lowers_inclusive)
+
+    @property
+    def lowers_exclusive(self) -> list[Version]:
+        """All lower bounds in exclusive form.
+
+        Returns:
+            New list built from the shared parse result on each access.
+        """
+        return list(self.parsed.lowers_exclusive)
+
+    @property
+    def lowers_exclusive_to_inclusive(self) -> list[Version]:
+        """Exclusive lower bounds converted to inclusive by incrementing micro.
+
+        Returns:
+            New list built from the shared parse result on each access.
+        """
+        return list(self.parsed.lowers_exclusive_to_inclusive)
+
+    @property
+    def uppers_inclusive(self) -> list[Version]:
+        """All upper bounds in inclusive form.
+
+        Returns:
+            New list built from the shared parse result on each access.
+        """
+        return list(self.parsed.uppers_inclusive)
+
+    @property
+    def uppers_exclusive(self) -> list[Version]:
+        """All upper bounds in exclusive form.
+
+        Returns:
+            New list built from the shared parse result on each access.
+        """
+        return list(self.parsed.uppers_exclusive)
+
+    @property
+    def uppers_inclusive_to_exclusive(self) -> list[Version]:
+        """Inclusive upper bounds converted to exclusive by incrementing micro.
+
+        Returns:
+            New list built from the shared parse result on each access.
+        """
+        return list(self.parsed.uppers_inclusive_to_exclusive)
 
     def get_lower_inclusive(
         self, default: str | Version | None = None
@@ -195,11 +491,9 @@ class VersionConstraint:
         Note:
             Conversion increments micro version: ">3.7.0" -> ">=3.7.1", not ">=3.8.0".
         """
-        default = str(default) if default else None
-        if self.lower_inclusive is None:
-            return Version(default) if default else None
-
-        return self.lower_inclusive
+        if self.lower_inclusive is not None or not default:
+            return self.lower_inclusive
+        return default if isinstance(default, Version) else parse_version(default)
 
     def get_upper_exclusive(
         self, default: str | Version | None = None
@@ -228,11 +522,9 @@ class VersionConstraint:
         Note:
             Conversion increments micro version: "<=3.11.5" -> "<3.11.6", not "<3.12.0".
         """
-        default = str(default) if default else None
-        if self.upper_exclusive is None:
-            return Version(default) if default else None
-
-        return self.upper_exclusive
+        if self.upper_exclusive is not None or not default:
+            return self.upper_exclusive
+        return default if isinstance(default, Version) else parse_version(default)
 
     def get_upper_inclusive(
         self, default: str | Version | None = None
@@ -262,32 +554,30 @@ class VersionConstraint:
 
         Note:
             Default incremented by one micro before use: "4.0" -> "4.0.1" -> "<=4.0.0".
+            The bound of the constraint itself is computed once in __init__.
         """
+        if self.upper_inclusive is not None or not default:
+            return self.upper_inclusive
+
         # increment the default by 1 micro to make it exclusive
-        if default:
-            default = Version(str(default))
-            default = Version(f"{default.major}.{default.minor}.{default.micro + 1}")
-        upper_exclusive = self.get_upper_exclusive(default)
-        if upper_exclusive is None:
-            return None
-
-        if upper_exclusive.micro != 0:
-            return Version(
-                f"{upper_exclusive.major}.{upper_exclusive.minor}.{upper_exclusive.micro - 1}"  # noqa: E501
-            )
-        if upper_exclusive.minor != 0:
-            return Version(f"{upper_exclusive.major}.{upper_exclusive.minor - 1}")
-        return Version(f"{upper_exclusive.major - 1}")
+        if not isinstance(default, Version):
+            default = parse_version(default)
+        upper_exclusive = bump_micro_version(
+            default.major, default.minor, default.micro
+        )
+        return get_previous_release_version(
+            upper_exclusive.major, upper_exclusive.minor, upper_exclusive.micro
+        )
 
     def get_version_range(
         self,
         level: Literal["major", "minor", "micro"] = "major",
         lower_default: str | Version | None = None,
         upper_default: str | Version | None = None,
-    ) -> list[Version]:
-        """Generate a list of versions within the constraint at specified precision.
+    ) -> tuple[Version, ...]:
+        """Generate the versions within the constraint at specified precision.
 
-        Creates list of all versions satisfying the constraint, incrementing at
+        Creates tuple of all versions satisfying the constraint, incrementing at
         specified level. Useful for test matrices, listing supported versions, or
         iterating over ranges.
 
@@ -305,8 +595,9 @@ class VersionConstraint:
                 String or Version. Raises ValueError if None and no constraint bound.
 
         Returns:
-            List of Version objects satisfying constraint, sorted ascending. May be
-            empty if no versions satisfy constraint.
+            Tuple of Version objects satisfying constraint, sorted ascending. May be
+            empty if no versions satisfy constraint. Immutable, so the cached
+            result is returned as is and can itself be cached or hashed.
 
         Raises:
             ValueError: If no lower or upper bound can be determined.
@@ -314,65 +605,75 @@ class VersionConstraint:
         Examples:
             >>> vc = VersionConstraint(">=3.8,<3.12")
             >>> vc.get_version_range(level="minor")
-            [<Version('3.8')>, <Version('3.9')>, <Version('3.10')>, <Version('3.11')>]
+            (<Version('3.8')>, <Version('3.9')>, <Version('3.10')>, <Version('3.11')>)
             >>> vc = VersionConstraint(">=3.10.1,<=3.10.3")
             >>> vc.get_version_range(level="micro")
-            [<Version('3.10.1')>, <Version('3.10.2')>, <Version('3.10.3')>]
+            (<Version('3.10.1')>, <Version('3.10.2')>, <Version('3.10.3')>)
 
         Note:
-            Generates all version combinations between bounds, then filters using
-            constraint's contains() method. Handles complex constraints properly.
+            Generates all version combinations between bounds, then filters them
+            against the constraint. Handles complex constraints properly. Results
+            are cached per spec, level and defaults, see generate_version_range.
         """
-        lower = self.get_lower_inclusive(lower_default)
-        upper = self.get_upper_inclusive(upper_default)
-
-        if lower is None or upper is None:
-            msg = "No lower or upper bound. Please specify default values."
-            raise ValueError(msg)
-
-        major_level, minor_level, micro_level = range(3)
-        level_int = {"major": major_level, "minor": minor_level, "micro": micro_level}[
-            level
-        ]
-        lower_as_list = [lower.major, lower.minor, lower.micro]
-        upper_as_list = [upper.major, upper.minor, upper.micro]
-
-        versions: list[list[int]] = []
-        for major in range(lower_as_list[major_level], upper_as_list[major_level] + 1):
-            version = [major]
-
-            minor_lower_og, minor_upper_og = (
-                lower_as_list[minor_level],
-                upper_as_list[minor_level],
-            )
-            diff = minor_upper_og - minor_lower_og
-            minor_lower = minor_lower_og if diff >= 0 else 0
-            minor_upper = minor_upper_og if diff >= 0 else minor_lower_og + abs(diff)
-            for minor in range(
-                minor_lower,
-                minor_upper + 1,
-            ):
-                # pop the minor if one already exists
-                if len(version) > minor_level:
-                    version.pop()
-
-                version.append(minor)
-
-                micro_lower_og, micro_upper_og = (
-                    lower_as_list[micro_level],
-                    upper_as_list[micro_level],
-                )
-                diff = micro_upper_og - micro_lower_og
-                micro_lower = micro_lower_og if diff >= 0 else 0
-                micro_upper = (
-                    micro_upper_og if diff >= 0 else micro_lower_og + abs(diff)
-                )
-                for micro in range(
-                    micro_lower,
-                    micro_upper + 1,
-                ):
-                    version.append(micro)
-                    versions.append(version[: level_int + 1])
-                    version.pop()
-        version_versions = sorted({Version(".".join(map(str, v))) for v in versions})
-        return [v for v in version_versions if self.sset.contains(v)]
+        return generate_version_range(self.spec, level, lower_default, upper_default)
+
+
+@lru_cache(maxsize=1024)
+def generate_version_range(
+    spec: str,
+    level: Literal["major", "minor", "micro"],
+    lower_default: str | Version | None,
+    upper_default: str | Version | None,
+) -> tuple[Version, ...]:
+    """Generate the versions within a specifier, cached per arguments.
+
+    Backs VersionConstraint.get_version_range. Constraints are immutable once
+    parsed, so the same test matrix (e.g. requires-python at minor level) is
+    computed once per process.
+
+    Args:
+        spec: Cleaned PEP 440 specifier string without quotes.
+        level: Precision level for increments.
+        lower_default: Default lower bound if the spec doesn't specify one.
+        upper_default: Default upper bound if the spec doesn't specify one.
+
+    Returns:
+        Tuple of versions satisfying the spec, sorted ascending. A tuple so the
+        cached value cannot be mutated by callers.
+
+    Raises:
+        ValueError: If no lower or upper bound can be determined.
+    """
+    constraint = VersionConstraint(spec)
+    lower = constraint.get_lower_inclusive(lower_default)
+    upper = constraint.get_upper_inclusive(upper_default)
+
+    if lower is None or upper is None:
+        msg = "No lower or upper bound. Please specify default values."
+        raise ValueError(msg)
+
+    level_int = VERSION_LEVEL_INDEXES[level]
+    majors = range(lower.major, upper.major + 1)
+    # components below the requested level are fixed to 0 and sliced off
+    minors = get_component_range(lower.minor, upper.minor) if level != "major" else (0,)
+    micros = get_component_range(lower.micro, upper.micro) if level == "micro" else (0,)
+    # product emits ascending tuples and only single zeros are sliced off,
+    # so the releases are unique and already sorted
+    releases = (release[: level_int + 1] for release in product(majors, minors, micros))
+    version_versions = [parse_version(".".join(map(str, r))) for r in releases]
+    if constraint.simple_bounds_only:
+        # plain comparisons and a set lookup, contains() re-checks every
+        # specifier per version
+        lower_inclusive, upper_exclusive, excluded_versions = (
+            constraint.lower_inclusive,
+            constraint.upper_exclusive,
+            constraint.excluded_versions,
+        )
+        return tuple(
+            v
+            for v in version_versions
+            if (lower_inclusive is None or v >= lower_inclusive)
+            and (upper_exclusive is None or v < upper_exclusive)
+            and v not in excluded_versions
+        )
+    return tuple(v for v in version_versions if constraint.sset.contains(v))
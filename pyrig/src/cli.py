@@ -4,6 +4,7 @@ Enables context-aware CLI behavior by determining which project is being invoked
 """
 
 import sys
+from functools import cache
 from pathlib import Path
 
 from pyrig.src.modules.package import get_pkg_name_from_project_name
@@ -17,7 +18,7 @@ def get_project_name_from_argv() -> str:
     Returns:
         Project name from the console script entry point.
     """
-    return Path(sys.argv[0]).name
+    return get_project_name_from_script(sys.argv[0])
 
 
 def get_pkg_name_from_argv() -> str:
@@ -28,5 +29,33 @@ def get_pkg_name_from_argv() -> str:
     Returns:
         Python package name corresponding to the invoked project.
     """
-    project_name = get_project_name_from_argv()
-    return get_pkg_name_from_project_name(project_name)
+    return get_pkg_name_from_script(sys.argv[0])
+
+
+@cache
+def get_project_name_from_script(script: str) -> str:
+    """Get the project name from a console script path, cached per path.
+
+    Keyed on the path, so a replaced `sys.argv[0]` is picked up without
+    clearing the cache.
+
+    Args:
+        script: Path of the invoked console script, usually `sys.argv[0]`.
+
+    Returns:
+        Project name, the file name of the script.
+    """
+    return Path(script).name
+
+
+@cache
+def get_pkg_name_from_script(script: str) -> str:
+    """Get the Python package name from a console script path, cached per path.
+
+    Args:
+        script: Path of the invoked console script, usually `sys.argv[0]`.
+
+    Returns:
+        Python package name corresponding to the script's project.
+    """
+    return get_pkg_name_from_project_name(get_project_name_from_script(script))
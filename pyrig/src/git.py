@@ -1,12 +1,15 @@
 """Git repository utilities for URL parsing and GitHub integration.
 
 Provides utilities for extracting repository information from git config and generating
-GitHub-related URLs (Pages, PyPI, badges, workflows).
+GitHub-related URLs (Pages, PyPI, badges, workflows). Config values and URLs are
+cached per process, reset_git_caches clears them.
 """
 
+import configparser
 import logging
 import os
-from functools import cache
+import re
+from functools import cache, lru_cache
 from pathlib import Path
 from subprocess import CompletedProcess  # nosec: B404
 from urllib.parse import quote
@@ -16,11 +19,76 @@ from pyrig.src.processes import run_subprocess
 
 logger = logging.getLogger(__name__)
 
+# Pre-compiled regex for the owner and repository of a git remote URL.
+# Matches the last two path segments of HTTPS ("https://github.com/owner/repo.git")
+# and SSH ("git@github.com:owner/repo.git") URLs, without ".git" or trailing "/".
+GIT_REMOTE_OWNER_REPO_PATTERN = re.compile(r"[:/]([^/:]+)/([^/]+?)(?:\.git)?/?$")
+
+
+def find_git_config_path(start: Path) -> Path | None:
+    """Find the .git/config file of the repository containing a directory.
+
+    Args:
+        start: Directory to search from, walking up its parents.
+
+    Returns:
+        Path to the config file, or None if no repository was found or its
+        .git is a file (worktree or submodule), where only git resolves the
+        actual config location.
+    """
+    for directory in (start, *start.parents):
+        git_path = directory / ".git"
+        config_path = git_path / "config"
+        if config_path.is_file():
+            return config_path
+        if git_path.exists():
+            return None
+    return None
+
+
+def read_git_config_value(config_path: Path, section: str, option: str) -> str | None:
+    """Read a value from a git config file without spawning git.
+
+    Args:
+        config_path: Path to a git config file, e.g. .git/config.
+        section: Section name, e.g. 'remote "origin"'.
+        option: Option name, e.g. "url".
+
+    Returns:
+        Configured value, or empty string if the file, section or option is
+        missing. None if only git can answer: the file cannot be parsed or
+        has include or includeIf sections, which may override the value.
+
+    Note:
+        include and includeIf directives are not followed, callers run git
+        itself when None is returned.
+    """
+    parser = configparser.ConfigParser(
+        strict=False,
+        allow_no_value=True,
+        interpolation=None,
+        inline_comment_prefixes=("#", ";"),
+    )
+    try:
+        parser.read(config_path, encoding="utf-8")
+    except (configparser.Error, UnicodeDecodeError):
+        logger.debug("Could not parse git config %s", config_path)
+        return None
+    # section names are case-insensitive for git, e.g. [includeIf "gitdir:..."]
+    if any(name.lower().startswith("include") for name in parser.sections()):
+        logger.debug("Git config %s includes other files", config_path)
+        return None
+    value = parser.get(section, option, fallback=None) or ""
+    return value.strip().strip('"')
+
 
 @cache
 def get_repo_remote_from_git(*, check: bool = True) -> str:
     """Get the remote origin URL from git config.
 
+    Reads .git/config directly and only runs git if the remote is not found
+    there, e.g. in worktrees, or the file includes other config files.
+
     Args:
         check: Whether to raise exception if command fails.
 
@@ -31,35 +99,76 @@ def get_repo_remote_from_git(*, check: bool = True) -> str:
     Raises:
         subprocess.CalledProcessError: If check=True and command fails.
     """
+    config_path = find_git_config_path(Path.cwd())
+    if config_path is not None:
+        url = read_git_config_value(config_path, 'remote "origin"', "url")
+        if url:
+            return url
     stdout: str = run_subprocess(
         ["git", "config", "--get", "remote.origin.url"], check=check
     ).stdout.decode("utf-8")
     return stdout.strip()
 
 
+def get_global_git_config_paths() -> tuple[Path, ...]:
+    """Get the global git config files in git's order of precedence.
+
+    Resolves the same files as git: GIT_CONFIG_GLOBAL if set, otherwise
+    ~/.gitconfig before $XDG_CONFIG_HOME/git/config (default ~/.config).
+
+    Returns:
+        Global config paths, highest precedence first. They may not exist.
+    """
+    global_config = os.environ.get("GIT_CONFIG_GLOBAL")
+    if global_config is not None:
+        return (Path(global_config),)
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    return (Path.home() / ".gitconfig", Path(xdg_config_home) / "git" / "config")
+
+
 @cache
 def get_git_username() -> str:
     """Get git username from local config.
 
+    Reads the repository and global config files directly, in git's order of
+    precedence, and only runs git if none sets user.name. Config passed via
+    GIT_CONFIG_COUNT or git -c overrides every file, and include or includeIf
+    sections can override a file's own value, so in both cases git is asked.
+
     Returns:
         Configured git username (cached).
 
     Raises:
         subprocess.CalledProcessError: If user.name not configured.
     """
+    if not ("GIT_CONFIG_COUNT" in os.environ or "GIT_CONFIG_PARAMETERS" in os.environ):
+        config_paths = (
+            find_git_config_path(Path.cwd()),
+            *get_global_git_config_paths(),
+        )
+        for config_path in config_paths:
+            if config_path is None:
+                continue
+            username = read_git_config_value(config_path, "user", "name")
+            if username is None:
+                break
+            if username:
+                return username
     stdout: str = run_subprocess(["git", "config", "--get", "user.name"]).stdout.decode(
         "utf-8"
     )
     return stdout.strip()
 
 
+@cache
 def get_repo_owner_and_name_from_git(
     *, check_repo_url: bool = True, url_encode: bool = False
 ) -> tuple[str, str]:
     """Extract GitHub owner and repository name from git remote URL.
 
     Parses remote origin URL (HTTPS or SSH format). Falls back to git username
-    and current directory name if no remote configured.
+    and current directory name if no remote configured. Cached per arguments
+    like the remote itself, use reset_git_caches to recompute.
 
     Args:
         check_repo_url: Whether to raise exception if remote cannot be read.
@@ -78,6 +187,8 @@ def get_repo_owner_and_name_from_git(
         owner = get_git_username()
         repo = get_project_name_from_cwd()
         logger.debug("Derived repository: %s/%s", owner, repo)
+    elif match := GIT_REMOTE_OWNER_REPO_PATTERN.search(url):
+        owner, repo = match.groups()
     else:
         parts = url.removesuffix(".git").split("/")
         # keep last two parts
@@ -91,6 +202,28 @@ def get_repo_owner_and_name_from_git(
     return owner, repo
 
 
+def reset_git_caches() -> None:
+    """Clear the cached git config values and everything derived from them.
+
+    Needed when the current directory or the git config changes within a
+    process, e.g. in tests that switch to a temporary project.
+    """
+    get_repo_remote_from_git.cache_clear()
+    get_git_username.cache_clear()
+    get_repo_owner_and_name_from_git.cache_clear()
+    for url_func in (
+        get_repo_url_from_git,
+        get_github_pages_url_from_git,
+        get_codecov_url_from_git,
+        get_pypi_url_from_git,
+        get_pypi_badge_url_from_git,
+        get_workflow_run_url_from_git,
+        get_workflow_badge_url_from_git,
+        get_licence_badge_url_from_git,
+    ):
+        url_func.cache_clear()
+
+
 def get_git_unstaged_changes() -> str:
     """Get diff of unstaged changes.
 
@@ -127,6 +260,7 @@ def git_add_file(path: Path, *, check: bool = True) -> CompletedProcess[bytes]:
     return run_subprocess(["git", "add", str(path)], check=check)
 
 
+@cache
 def get_repo_url_from_git() -> str:
     """Construct HTTPS GitHub repository URL.
 
@@ -139,6 +273,7 @@ def get_repo_url_from_git() -> str:
     return f"https://github.com/{owner}/{repo}"
 
 
+@cache
 def get_github_pages_url_from_git() -> str:
     """Construct GitHub Pages URL.
 
@@ -154,6 +289,7 @@ def get_github_pages_url_from_git() -> str:
     return f"https://{owner}.github.io/{repo}"
 
 
+@cache
 def get_codecov_url_from_git() -> str:
     """Construct Codecov dashboard URL.
 
@@ -166,6 +302,7 @@ def get_codecov_url_from_git() -> str:
     return f"https://codecov.io/gh/{owner}/{repo}"
 
 
+@cache
 def get_pypi_url_from_git() -> str:
     """Construct PyPI package URL.
 
@@ -178,6 +315,7 @@ def get_pypi_url_from_git() -> str:
     return f"https://pypi.org/project/{repo}"
 
 
+@cache
 def get_pypi_badge_url_from_git() -> str:
     """Construct PyPI version badge URL.
 
@@ -188,6 +326,7 @@ def get_pypi_badge_url_from_git() -> str:
     return f"https://img.shields.io/pypi/v/{repo}?logo=pypi&logoColor=white"
 
 
+@lru_cache(maxsize=64)
 def get_workflow_run_url_from_git(workflow_name: str) -> str:
     """Construct GitHub Actions workflow run URL.
 
@@ -203,6 +342,7 @@ def get_workflow_run_url_from_git(workflow_name: str) -> str:
     return f"https://github.com/{owner}/{repo}/actions/workflows/{workflow_name}.yaml"
 
 
+@lru_cache(maxsize=64)
 def get_workflow_badge_url_from_git(workflow_name: str, label: str, logo: str) -> str:
     """Construct GitHub Actions workflow status badge URL.
 
@@ -220,6 +360,7 @@ def get_workflow_badge_url_from_git(workflow_name: str, label: str, logo: str) -
     return f"https://img.shields.io/github/actions/workflow/status/{owner}/{repo}/{workflow_name}.yaml?label={label}&logo={logo}"
 
 
+@cache
 def get_licence_badge_url_from_git() -> str:
     """Construct GitHub license badge URL.
 
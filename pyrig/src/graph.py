@@ -3,12 +3,15 @@
 Provides a DiGraph with bidirectional traversal for analyzing dependency relationships.
 """
 
-import heapq
-from collections import deque
+from collections.abc import Iterable, KeysView
 from typing import Self
 
 from pyrig.src.modules.class_ import get_cached_instance
 
+# Shared default for adjacency lookups of unknown nodes.
+# Iterating or intersecting it allocates nothing, unlike a fresh set() per miss.
+EMPTY_NODES: frozenset[str] = frozenset()
+
 
 class DiGraph:
     """Directed graph with bidirectional traversal.
@@ -16,9 +19,10 @@ class DiGraph:
     Maintains forward and reverse edges for O(1) neighbor lookups.
 
     Attributes:
-        _nodes: All node identifiers.
-        _edges: Forward adjacency (node → outgoing neighbors).
+        _edges: Forward adjacency (node → outgoing neighbors). Its keys are
+            the canonical node set.
         _reverse_edges: Reverse adjacency (node → incoming neighbors).
+        _ancestors_cache: Ancestors per target, cleared when an edge is added.
     """
 
     @classmethod
@@ -32,9 +36,9 @@ class DiGraph:
 
     def __init__(self) -> None:
         """Initialize empty directed graph."""
-        self._nodes: set[str] = set()
         self._edges: dict[str, set[str]] = {}  # node -> outgoing neighbors
         self._reverse_edges: dict[str, set[str]] = {}  # node -> incoming neighbors
+        self._ancestors_cache: dict[str, frozenset[str]] = {}
 
     def add_node(self, node: str) -> None:
         """Add node to graph.
@@ -42,11 +46,8 @@ class DiGraph:
         Args:
             node: Node identifier.
         """
-        self._nodes.add(node)
-        if node not in self._edges:
-            self._edges[node] = set()
-        if node not in self._reverse_edges:
-            self._reverse_edges[node] = set()
+        self._edges.setdefault(node, set())
+        self._reverse_edges.setdefault(node, set())
 
     def add_edge(self, source: str, target: str) -> None:
         """Add directed edge from source to target.
@@ -55,10 +56,12 @@ class DiGraph:
             source: Edge origin (depends on target).
             target: Edge destination (dependency of source).
         """
-        self.add_node(source)
-        self.add_node(target)
-        self._edges[source].add(target)
-        self._reverse_edges[target].add(source)
+        self._edges.setdefault(source, set()).add(target)
+        self._reverse_edges.setdefault(target, set()).add(source)
+        self._edges.setdefault(target, set())
+        self._reverse_edges.setdefault(source, set())
+        # a new edge can extend the ancestors of any node, new nodes alone cannot
+        self._ancestors_cache.clear()
 
     def __contains__(self, node: str) -> bool:
         """Check if node exists.
@@ -69,7 +72,7 @@ class DiGraph:
         Returns:
             True if node exists.
         """
-        return node in self._nodes
+        return node in self._edges
 
     def __getitem__(self, node: str) -> set[str]:
         """Get outgoing neighbors (dependencies) of node.
@@ -82,13 +85,13 @@ class DiGraph:
         """
         return self._edges.get(node, set())
 
-    def nodes(self) -> set[str]:
+    def nodes(self) -> KeysView[str]:
         """Return all nodes.
 
         Returns:
-            Set of all node identifiers.
+            Live set-like view of all node identifiers.
         """
-        return self._nodes
+        return self._edges.keys()
 
     def has_edge(self, source: str, target: str) -> bool:
         """Check if directed edge exists.
@@ -100,40 +103,98 @@ class DiGraph:
         Returns:
             True if edge exists.
         """
-        return target in self._edges.get(source, set())
+        return target in self._edges.get(source, EMPTY_NODES)
 
     def ancestors(self, target: str) -> set[str]:
         """Find all nodes that can reach target (transitive dependents).
 
-        Uses BFS with deque for O(1) popleft instead of O(n) list.pop(0).
+        Uses a level-synchronous BFS: each level is expanded with C-level set
+        unions and differences instead of per-neighbor membership checks.
+        Results are cached per target until the next add_edge.
 
         Args:
             target: Node to find ancestors for.
 
         Returns:
-            Set of all nodes with path to target (excludes target).
+            Set of all nodes with path to target (excludes target). A new set
+            on each call, callers may modify it.
         """
         if target not in self:
             return set()
+        cached_ancestors = self._ancestors_cache.get(target)
+        if cached_ancestors is not None:
+            return set(cached_ancestors)
+
+        reverse_edges = self._reverse_edges
+        visited: set[str] = set()
+        frontier: set[str] = set(reverse_edges[target])
+
+        while frontier:
+            visited |= frontier
+            # every node in the graph has a reverse edge entry
+            frontier = set().union(*(reverse_edges[node] for node in frontier))
+            frontier -= visited
+
+        self._ancestors_cache[target] = frozenset(visited)
+        return visited
 
+    def ancestors_many(self, targets: Iterable[str]) -> set[str]:
+        """Find all nodes that can reach any of the targets.
+
+        Runs one multi-source BFS from all targets together, so ancestry shared
+        between targets is only walked once instead of once per target.
+
+        Args:
+            targets: Nodes to find ancestors for. Unknown nodes are ignored.
+
+        Returns:
+            Union of the ancestors of each target. A target is only included
+            if it can reach another target.
+        """
+        reverse_edges = self._reverse_edges
         visited: set[str] = set()
-        queue: deque[str] = deque(self._reverse_edges.get(target, set()))
+        frontier: set[str] = set().union(
+            *(reverse_edges[target] for target in targets if target in self)
+        )
 
-        while queue:
-            node = queue.popleft()
-            if node not in visited:
-                visited.add(node)
-                # Iterate directly to avoid creating intermediate set
-                for neighbor in self._reverse_edges.get(node, set()):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
+        while frontier:
+            visited |= frontier
+            frontier = set().union(*(reverse_edges[node] for node in frontier))
+            frontier -= visited
 
         return visited
 
+    def all_ancestors(self) -> dict[str, frozenset[str]]:
+        """Find the ancestors of every node in one pass.
+
+        Walks the nodes in reverse topological order (dependents first), so each
+        node's ancestors are the union of its direct dependents and their
+        already computed ancestors. Touches every edge once instead of running
+        one BFS per node. Fills the cache used by ancestors.
+
+        Returns:
+            Dict mapping each node to the nodes with a path to it.
+
+        Raises:
+            ValueError: If the graph contains a cycle.
+        """
+        order = self.topological_sort_subgraph(set(self._edges))
+        reverse_edges = self._reverse_edges
+        all_ancestors: dict[str, frozenset[str]] = {}
+        for node in reversed(order):
+            dependents = reverse_edges[node]
+            all_ancestors[node] = frozenset(dependents).union(
+                *(all_ancestors[dependent] for dependent in dependents)
+            )
+        self._ancestors_cache.update(all_ancestors)
+        return all_ancestors
+
     def shortest_path_length(self, source: str, target: str) -> int:
         """Find shortest path length between nodes.
 
-        Uses BFS with deque for O(1) popleft instead of O(n) list.pop(0).
+        Uses a bidirectional BFS, forward from source and backward from target
+        via the reverse edges, always expanding the smaller frontier by one full
+        level. Touches about 2·b^(d/2) instead of b^d nodes for distance d.
 
         Args:
             source: Starting node.
@@ -152,17 +213,37 @@ class DiGraph:
         if source == target:
             return 0
 
-        visited: set[str] = {source}
-        queue: deque[tuple[str, int]] = deque([(source, 0)])
-
-        while queue:
-            node, distance = queue.popleft()
-            for neighbor in self._edges.get(node, set()):
-                if neighbor == target:
-                    return distance + 1
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, distance + 1))
+        distances_fwd: dict[str, int] = {source: 0}
+        distances_bwd: dict[str, int] = {target: 0}
+        frontier_fwd: list[str] = [source]
+        frontier_bwd: list[str] = [target]
+
+        while frontier_fwd and frontier_bwd:
+            forward = len(frontier_fwd) <= len(frontier_bwd)
+            frontier, distances, other_distances, adjacency = (
+                (frontier_fwd, distances_fwd, distances_bwd, self._edges)
+                if forward
+                else (frontier_bwd, distances_bwd, distances_fwd, self._reverse_edges)
+            )
+            next_frontier: list[str] = []
+            # path lengths through nodes reached from both sides in this level,
+            # the level is completed first so the minimum is the shortest path
+            meeting_lengths: list[int] = []
+            for node in frontier:
+                distance = distances[node] + 1
+                for neighbor in adjacency[node]:
+                    if neighbor in distances:
+                        continue
+                    distances[neighbor] = distance
+                    next_frontier.append(neighbor)
+                    if neighbor in other_distances:
+                        meeting_lengths.append(distance + other_distances[neighbor])
+            if meeting_lengths:
+                return min(meeting_lengths)
+            if forward:
+                frontier_fwd = next_frontier
+            else:
+                frontier_bwd = next_frontier
 
         msg = f"No path from {source} to {target}"
         raise ValueError(msg)
@@ -170,8 +251,8 @@ class DiGraph:
     def topological_sort_subgraph(self, nodes: set[str]) -> list[str]:
         """Topologically sort subset of nodes (dependencies before dependents).
 
-        Uses Kahn's algorithm with a min-heap for O(log n) insertions and O(1) pop
-        instead of O(n log n) sort + O(n) pop(0) per iteration.
+        Uses Kahn's algorithm processing ready nodes layer by layer in O(V + E),
+        each layer sorted once so the order is deterministic across runs.
         Edge A → B means "A depends on B", so B appears before A.
 
         Args:
@@ -185,29 +266,31 @@ class DiGraph:
         """
         # Count outgoing edges (dependencies) for each node in the subgraph
         # Nodes with 0 outgoing edges have no dependencies
-        out_degree: dict[str, int] = dict.fromkeys(nodes, 0)
-
-        for node in nodes:
-            for dependency in self._edges.get(node, set()):
-                if dependency in nodes:
-                    out_degree[node] += 1
-
-        # Use heapq for O(log n) insertion maintaining sorted order
-        # This replaces O(n log n) sort() + O(n) pop(0) with O(log n) heappop()
-        heap: list[str] = [node for node in nodes if out_degree[node] == 0]
-        heapq.heapify(heap)
+        edges_get, reverse_edges_get = self._edges.get, self._reverse_edges.get
+        out_degree: dict[str, int] = {
+            node: len(edges_get(node, EMPTY_NODES) & nodes) for node in nodes
+        }
+
+        # Dependents within the subgraph, filtered once by C-level set intersection
+        dependents: dict[str, set[str] | frozenset[str]] = {
+            node: reverse_edges_get(node, EMPTY_NODES) & nodes for node in nodes
+        }
+
+        # Process ready nodes as FIFO layers instead of a heap, sorting each
+        # layer once keeps the result independent of set iteration order
+        ready: list[str] = sorted(node for node in nodes if out_degree[node] == 0)
         result: list[str] = []
 
-        while heap:
-            node = heapq.heappop(heap)
-            result.append(node)
-
-            # For each package that depends on this node (reverse edges)
-            for dependent in self._reverse_edges.get(node, set()):
-                if dependent in nodes:
+        while ready:
+            result.extend(ready)
+            next_ready: list[str] = []
+            for node in ready:
+                # For each package that depends on this node (reverse edges)
+                for dependent in dependents[node]:
                     out_degree[dependent] -= 1
                     if out_degree[dependent] == 0:
-                        heapq.heappush(heap, dependent)
+                        next_ready.append(dependent)
+            ready = sorted(next_ready)
 
         # Check for cycles
         if len(result) != len(nodes):
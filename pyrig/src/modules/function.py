@@ -4,19 +4,20 @@ Utilities for identifying callable objects and extracting functions from modules
 Handles functions, methods, staticmethods, classmethods, properties, and decorators.
 """
 
-import inspect
 from collections.abc import Callable
 from importlib import import_module
-from types import ModuleType
+from types import FunctionType, MethodType, ModuleType
 from typing import Any
 
 from pyrig.src.modules.inspection import (
     get_def_line,
     get_module_of_obj,
-    get_obj_members,
     get_unwrapped_obj,
 )
 
+# Same types inspect.isfunction and inspect.ismethod test, checked in one call
+FUNCTION_OR_METHOD_TYPES = (FunctionType, MethodType)
+
 
 def is_func_or_method(obj: Any) -> bool:
     """Check if an object is a plain function or bound method.
@@ -30,7 +31,7 @@ def is_func_or_method(obj: Any) -> bool:
     Note:
         Does NOT detect staticmethod/classmethod/property. Use `is_func()` for those.
     """
-    return inspect.isfunction(obj) or inspect.ismethod(obj)
+    return isinstance(obj, FUNCTION_OR_METHOD_TYPES)
 
 
 def is_func(obj: Any) -> bool:
@@ -48,6 +49,12 @@ def is_func(obj: Any) -> bool:
     if is_func_or_method(obj):
         return True
 
+    # nothing to unwrap (ints, strings, most classes), so unwrapping cannot help
+    if not (
+        hasattr(obj, "__func__") or hasattr(obj, "fget") or hasattr(obj, "__wrapped__")
+    ):
+        return False
+
     unwrapped = get_unwrapped_obj(obj)
 
     return is_func_or_method(unwrapped)
@@ -69,11 +76,19 @@ def get_all_functions_from_module(
     """
     if isinstance(module, str):
         module = import_module(module)
-    funcs = [
-        func
-        for _name, func in get_obj_members(module, include_annotate=include_annotate)
-        if is_func(func)
-        if get_module_of_obj(func).__name__ == module.__name__
-    ]
-    # sort by definition order
-    return sorted(funcs, key=get_def_line)
+    module_name = module.__name__
+    # a module's members are its namespace dict, read it directly instead of
+    # the sorted dir() and getattr_static walk of get_obj_members
+    funcs: list[Callable[..., Any]] = []
+    for name, func in vars(module).items():
+        if not include_annotate and name in ("__annotate__", "__annotate_func__"):
+            continue
+        # plain functions, the bulk of matches, carry their module name directly
+        if type(func) is FunctionType:
+            if func.__module__ == module_name:
+                funcs.append(func)
+        elif is_func(func) and get_module_of_obj(func).__name__ == module_name:
+            funcs.append(func)
+    # sort by definition order, in place since funcs is a fresh local list
+    funcs.sort(key=get_def_line)
+    return funcs
@@ -83,7 +83,9 @@ def get_unwrapped_obj(obj: Any) -> Any:
             obj = obj.__func__
         if hasattr(obj, "fget"):
             obj = obj.fget
-        obj = inspect.unwrap(obj)
+        # most objects are not decorated, skip the memo set inspect.unwrap builds
+        if hasattr(obj, "__wrapped__"):
+            obj = inspect.unwrap(obj)
     return obj
 
 
@@ -9,6 +9,7 @@ import importlib.util
 import logging
 import sys
 from collections.abc import Callable
+from functools import cache
 from importlib import import_module
 from pathlib import Path
 from types import ModuleType
@@ -38,6 +39,22 @@ def get_module_content_as_str(module: ModuleType) -> str:
     return path.read_text(encoding="utf-8")
 
 
+@cache
+def get_module_docstring_as_str(module: ModuleType) -> str:
+    """Read the raw module docstring of a module from its source file.
+
+    Cached per module so each source file is read and split at most once,
+    no matter how many config files copy the same docstring.
+
+    Args:
+        module: Module whose source starts with a triple-quoted docstring.
+
+    Returns:
+        Raw text between the first pair of triple quotes, unmodified.
+    """
+    return get_module_content_as_str(module).split('"""', 2)[1]
+
+
 def create_module(path: Path) -> ModuleType:
     """Create a module at the given path, or import if it exists.
 
@@ -6,6 +6,7 @@ Used throughout pyrig for running external tools (git, uv, pytest, pre-commit).
 Utilities:
     - run_subprocess: Execute commands with detailed error logging
     - Args: Command builder for fluent subprocess execution
+    - build_args: Cached Args construction for tool commands
 
 Example:
     >>> from pyrig.src.processes import run_subprocess, Args
@@ -16,6 +17,7 @@ Example:
 import logging
 import subprocess  # nosec: B404
 from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -125,3 +127,20 @@ class Args(tuple[str, ...]):
             subprocess.CalledProcessError: If check=True and command fails.
         """
         return run_subprocess(self, *args, **kwargs)
+
+
+@lru_cache(maxsize=512)
+def build_args(name: str, parts: tuple[str, ...]) -> Args:
+    """Build an `Args` with the tool name prepended, interning the result.
+
+    Args are immutable, so repeated command constructions such as
+    `uv sync` return the same instance instead of a fresh tuple.
+
+    Args:
+        name: Tool command name (e.g., "uv", "git").
+        parts: Command arguments following the tool name.
+
+    Returns:
+        Cached Args object with name and parts.
+    """
+    return Args((name, *parts))
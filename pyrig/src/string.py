@@ -9,6 +9,11 @@ from collections.abc import Callable
 from types import ModuleType
 from typing import Any
 
+# Pre-compiled regexes, compiled once at module load vs. per-call cache lookups.
+UPPERCASE_SPLIT_PATTERN = re.compile(r"(?=[A-Z])")
+# Either quote style in one alternation, so docstrings are stripped in a single pass
+TRIPLE_QUOTED_PATTERN = re.compile(r"\"\"\"[\s\S]*?\"\"\"|'''[\s\S]*?'''")
+
 
 def split_on_uppercase(string: str) -> list[str]:
     """Split string at uppercase letter boundaries.
@@ -23,7 +28,7 @@ def split_on_uppercase(string: str) -> list[str]:
         Consecutive uppercase split individually:
             "XMLParser" → ['X', 'M', 'L', 'Parser'].
     """
-    return [s for s in re.split(r"(?=[A-Z])", string) if s]
+    return [s for s in UPPERCASE_SPLIT_PATTERN.split(string) if s]
 
 
 def make_name_from_obj(
@@ -53,17 +58,19 @@ def make_name_from_obj(
         For non-string objects, only last component of `__name__` used.
         Does not handle PascalCase; use `split_on_uppercase` first if needed.
     """
-    if not isinstance(obj, str):
-        name = getattr(obj, "__name__", "")
+    if isinstance(obj, str):
+        obj_name = obj
+    else:
+        # getattr with a default keeps the callable branch of the union typed
+        name: str = getattr(obj, "__name__", "")
         if not name:
             msg = f"Cannot extract name from {obj}"
             raise ValueError(msg)
-        obj_name: str = name.split(".")[-1]
-    else:
-        obj_name = obj
+        obj_name = name.rpartition(".")[2]
     parts = obj_name.split(split_on)
     if capitalize:
-        parts = [part.capitalize() for part in parts]
+        # map with the unbound method avoids a list comprehension frame
+        return join_on.join(map(str.capitalize, parts))
     return join_on.join(parts)
 
 
@@ -79,8 +86,7 @@ def re_search_excluding_docstrings(
     Returns:
         Match object if found outside docstrings, None otherwise.
     """
-    content = re.sub(r'"""[\s\S]*?"""', "", content)
-    content = re.sub(r"'''[\s\S]*?'''", "", content)
+    content = TRIPLE_QUOTED_PATTERN.sub("", content)
     return re.search(pattern, content)
 
 
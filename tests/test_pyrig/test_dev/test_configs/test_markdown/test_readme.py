@@ -19,6 +19,5 @@ class TestReadmeConfigFile:
     def test_get_parent_path(self) -> None:
         """Test method for get_parent_path."""
         # just assert it returns a path
-        assert isinstance(ReadmeConfigFile.get_parent_path(), Path), (
-            f"Expected Path, got {type(ReadmeConfigFile.get_parent_path())}"
-        )
+        parent_path = ReadmeConfigFile.get_parent_path()
+        assert isinstance(parent_path, Path), f"Expected Path, got {type(parent_path)}"
@@ -27,9 +27,8 @@ class TestZeroTestConfigFile:
     ) -> None:
         """Test method for get_filename."""
         filename = my_test_zero_test_config_file.get_filename()
-        # ZeroTestConfigFile reverses the filename
-        assert filename.startswith("test_"), (
-            f"Expected filename to start with 'test_', got {filename}"
+        assert filename == "test_zero", (
+            f"Expected filename to be 'test_zero', got {filename}"
         )
 
     def test_get_content_str(
@@ -20,3 +20,6 @@ class TestTool:
         # Tool is abstract, test through concrete implementation
         result = PackageManager.L.get_args("run", "pytest")
         assert result == ("uv", "run", "pytest")
+        assert PackageManager.L.get_args("run", "pytest") is result, (
+            "Expected interned Args"
+        )
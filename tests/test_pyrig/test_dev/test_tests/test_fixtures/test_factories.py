@@ -7,6 +7,7 @@ from typing import Any
 import pytest
 
 from pyrig.dev.configs.base.base import ConfigFile
+from pyrig.src.git import get_repo_owner_and_name_from_git
 
 
 @pytest.fixture
@@ -66,3 +67,9 @@ def test_config_file_factory(
     assert path.name == "sample.test", (
         f"Expected filename 'sample.test', got {path.name}"
     )
+
+    # git values cached outside tmp_path must not be reused inside it
+    get_repo_owner_and_name_from_git()
+    sample_config_file.create_file()
+    info = get_repo_owner_and_name_from_git.cache_info()
+    assert info.currsize == 0, f"Expected cleared git caches, got {info}"
@@ -1,27 +1,42 @@
 """module."""
 
+import math
+import os
 from contextlib import chdir
 from pathlib import Path
 
+import pytest
+from github import Github, RateLimitExceededExceedsMaxWait, RateLimitExceededException
 from github.Repository import Repository
+from pytest_mock import MockFixture
 
 from pyrig.dev.cli.commands.protect_repo import get_default_ruleset_params
 from pyrig.dev.utils.git import (
     DEFAULT_RULESET_NAME,
     GITIGNORE_PATH,
+    as_gitignore_key,
     create_or_update_ruleset,
     get_all_rulesets,
+    get_github_client,
     get_github_repo_token,
+    get_github_repo_tokens,
+    get_gitignore_spec,
     get_repo,
     get_rules_payload,
+    get_rulesets_index,
+    get_token_remaining_rate_limit,
     github_api_request,
+    github_api_request_with_headers,
+    gitignore_spec_matches,
     load_gitignore,
     path_is_in_gitignore_lines,
+    paths_in_gitignore_lines,
     ruleset_exists,
 )
 from pyrig.src.git import (
     get_repo_owner_and_name_from_git,
 )
+from pyrig.src.modules.module import make_obj_importpath
 
 
 def test_get_rules_payload() -> None:
@@ -55,6 +70,23 @@ def test_get_rules_payload() -> None:
     assert len(rules) == expected_multiple_rules, (
         f"Expected {expected_multiple_rules} rules, got {len(rules)}"
     )
+    assert [rule["type"] for rule in rules] == [
+        "creation",
+        "deletion",
+        "pull_request",
+    ], "Expected rules in RULE_TYPES order"
+
+
+def test_get_github_client() -> None:
+    """Test func for get_github_client."""
+    client = get_github_client("dummy-token")
+    assert isinstance(client, Github), f"Expected Github, got {type(client)}"
+    assert get_github_client("dummy-token") is client, "Expected cached client"
+    retry = client.requester.kwargs["retry"]
+    assert retry.max_rate_limit_wait is None, "Expected default to wait for reset"
+    pooled = get_github_client("dummy-token", max_rate_limit_wait=0)
+    retry = pooled.requester.kwargs["retry"]
+    assert retry.max_rate_limit_wait == 0, "Expected pooled client not to wait"
 
 
 def test_get_repo() -> None:
@@ -69,8 +101,30 @@ def test_get_repo() -> None:
     assert repo.name == repo_name, f"Expected repo name {repo_name}, got {repo.name}"
 
 
-def test_get_all_rulesets() -> None:
+def test_get_all_rulesets(mocker: MockFixture, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test func for get_all_rulesets."""
+    mock_request = mocker.patch(
+        make_obj_importpath(github_api_request_with_headers),
+        return_value=({"etag": '"v1"'}, [{"id": 1, "name": "cached"}]),
+    )
+    first = get_all_rulesets("token", "owner", "cached-repo")
+    second = get_all_rulesets("token", "owner", "cached-repo")
+    assert first is second, "Expected cached rulesets on second call"
+    mock_request.assert_called_once()
+
+    # after the ttl the listing is revalidated with its etag, 304 keeps it
+    monkeypatch.setattr(
+        make_obj_importpath(get_all_rulesets).rsplit(".", 1)[0]
+        + ".RULESETS_CACHE_TTL_SECONDS",
+        0,
+    )
+    mock_request.return_value = ({"etag": '"v1"'}, None)
+    third = get_all_rulesets("token", "owner", "cached-repo")
+    assert third is first, "Expected cached rulesets on 304 Not Modified"
+    assert mock_request.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+    mocker.stopall()
+    monkeypatch.undo()
+
     rulesets = get_all_rulesets(
         get_github_repo_token(),
         *get_repo_owner_and_name_from_git(),
@@ -78,6 +132,17 @@ def test_get_all_rulesets() -> None:
     assert isinstance(rulesets, list), "Expected rulesets to be a list"
 
 
+def test_get_rulesets_index(mocker: MockFixture) -> None:
+    """Test func for get_rulesets_index."""
+    rulesets = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    mocker.patch(make_obj_importpath(get_all_rulesets), return_value=rulesets)
+    index = get_rulesets_index("token", "owner", "index-repo")
+    assert index == {"a": 1, "b": 2}, f"Expected name to id index, got {index}"
+    assert get_rulesets_index("token", "owner", "index-repo") is index, (
+        "Expected cached index for unchanged listing"
+    )
+
+
 def test_ruleset_exists() -> None:
     """Test func for ruleset_exists."""
     ruleset_id = ruleset_exists(
@@ -88,8 +153,27 @@ def test_ruleset_exists() -> None:
     assert ruleset_id > 0, f"Expected ruleset id > 0, got {ruleset_id}"
 
 
-def test_create_or_update_ruleset() -> None:
+def test_create_or_update_ruleset(mocker: MockFixture) -> None:
     """Test func for create_or_update_ruleset."""
+    # a write patches the cached listing with the listing fields only
+    mocker.patch(
+        make_obj_importpath(github_api_request_with_headers),
+        return_value=({}, [{"id": 1, "name": "old", "enforcement": "active"}]),
+    )
+    mock_request = mocker.patch(
+        make_obj_importpath(github_api_request),
+        return_value={"id": 2, "name": "new", "enforcement": "active", "rules": []},
+    )
+    create_or_update_ruleset("token", "owner", "patched-repo", name="new")
+    assert mock_request.call_args.kwargs["method"] == "POST", "Expected create"
+    rulesets = get_all_rulesets("token", "owner", "patched-repo")
+    expected = [
+        {"id": 1, "name": "old", "enforcement": "active"},
+        {"id": 2, "name": "new", "enforcement": "active"},
+    ]
+    assert rulesets == expected, f"Expected summaries, got {rulesets}"
+    mocker.stopall()
+
     token = get_github_repo_token()
     owner, repo_name = get_repo_owner_and_name_from_git()
     create_or_update_ruleset(
@@ -104,10 +188,38 @@ def test_get_github_repo_token() -> None:
     """Test func for get_github_token."""
     token = get_github_repo_token()
     assert isinstance(token, str), f"Expected token to be str, got {type(token)}"
+    assert get_github_repo_token() is token, "Expected cached token"
 
 
-def test_github_api_request() -> None:
+def test_github_api_request(mocker: MockFixture) -> None:
     """Test function."""
+    limited = mocker.MagicMock()
+    limited.requester.requestJsonAndCheck.side_effect = RateLimitExceededException(
+        403, {}, {}
+    )
+    working = mocker.MagicMock()
+    working.requester.requestJsonAndCheck.return_value = ({}, [{"id": 1}])
+    mock_client = mocker.patch(
+        make_obj_importpath(get_github_client),
+        side_effect=lambda key, **_: limited if key == "a" else working,
+    )
+    mocker.patch(make_obj_importpath(get_token_remaining_rate_limit), return_value=1)
+    res = github_api_request(("a", "b"), "owner", "repo", "rulesets")
+    assert res == [{"id": 1}], f"Expected result from second token, got {res}"
+    working.requester.requestJsonAndCheck.assert_called_once_with(
+        "GET", "/repos/owner/repo/rulesets", headers=mocker.ANY, input=None
+    )
+    # pooled clients must raise on rate limits instead of sleeping
+    mock_client.assert_called_with("b", max_rate_limit_wait=0)
+    limited.requester.requestJsonAndCheck.side_effect = RateLimitExceededExceedsMaxWait(
+        403, {}, {}, wait=3600
+    )
+    res = github_api_request(("a", "b"), "owner", "repo", "rulesets")
+    assert res == [{"id": 1}], f"Expected rotation past a long wait, got {res}"
+    with pytest.raises(RateLimitExceededException):
+        github_api_request("a", "owner", "repo", "rulesets")
+    mocker.stopall()
+
     github_api_request(
         get_github_repo_token(),
         *get_repo_owner_and_name_from_git(),
@@ -116,7 +228,65 @@ def test_github_api_request() -> None:
     )
 
 
-def test_path_is_in_gitignore_lines(tmp_path: Path) -> None:
+def test_get_gitignore_spec() -> None:
+    """Test func for get_gitignore_spec."""
+    lines = ("*.pyc", "build/")
+    spec = get_gitignore_spec(lines)
+    assert spec.match_file("folder/file.pyc"), "Expected *.pyc to match"
+    assert spec.match_file("build/"), "Expected build/ to match"
+    assert not spec.match_file("file.py"), "Expected file.py not to match"
+    assert get_gitignore_spec(("*.pyc", "build/")) is spec, (
+        "Expected cached spec for equal lines"
+    )
+    assert get_gitignore_spec.cache_info().maxsize is not None, (
+        "Expected a bounded spec cache"
+    )
+
+
+def test_gitignore_spec_matches() -> None:
+    """Test func for gitignore_spec_matches."""
+    lines = ("*.pyc", "build/")
+    assert gitignore_spec_matches(lines, "folder/file.pyc"), "Expected match"
+    assert gitignore_spec_matches(lines, "build/"), "Expected dir match"
+    assert not gitignore_spec_matches(lines, "build"), "Expected no file match"
+    hits = gitignore_spec_matches.cache_info().hits
+    gitignore_spec_matches(lines, "folder/file.pyc")
+    assert gitignore_spec_matches.cache_info().hits == hits + 1, (
+        "Expected repeated query to hit the cache"
+    )
+
+
+def test_github_api_request_with_headers(mocker: MockFixture) -> None:
+    """Test func for github_api_request_with_headers."""
+    client = mocker.MagicMock()
+    client.requester.requestJsonAndCheck.return_value = ({"etag": '"v1"'}, None)
+    mocker.patch(make_obj_importpath(get_github_client), return_value=client)
+    response_headers, res = github_api_request_with_headers(
+        "token", "owner", "repo", "rulesets", headers={"If-None-Match": '"v1"'}
+    )
+    assert response_headers == {"etag": '"v1"'}, "Expected response headers"
+    assert res is None, f"Expected empty body, got {res}"
+    sent = client.requester.requestJsonAndCheck.call_args.kwargs["headers"]
+    assert sent["If-None-Match"] == '"v1"', "Expected extra header to be sent"
+    assert sent["Accept"] == "application/vnd.github+json", "Expected defaults"
+
+
+def test_get_token_remaining_rate_limit() -> None:
+    """Test func for get_token_remaining_rate_limit."""
+    remaining = get_token_remaining_rate_limit("unused-token")
+    assert remaining == math.inf, f"Expected unknown limit as inf, got {remaining}"
+
+
+def test_get_github_repo_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test func for get_github_repo_tokens."""
+    get_github_repo_tokens.cache_clear()
+    monkeypatch.setenv("REPO_TOKENS", "a, b,,c")
+    tokens = get_github_repo_tokens()
+    assert tokens == ("a", "b", "c"), f"Expected parsed token pool, got {tokens}"
+    get_github_repo_tokens.cache_clear()
+
+
+def test_path_is_in_gitignore_lines(tmp_path: Path, mocker: MockFixture) -> None:
     """Test func for path_is_in_gitignore."""
     with chdir(tmp_path):
         content = """
@@ -142,6 +312,50 @@ dist/
             gitignore_lines, "folder/folder.egg-info/file.py"
         )
 
+        # known directories skip detection, so build matches only as a dir
+        assert path_is_in_gitignore_lines(gitignore_lines, "build", is_dir=True)
+        assert not path_is_in_gitignore_lines(gitignore_lines, "build", is_dir=False)
+        # a trailing slash marks a directory without touching the filesystem
+        assert path_is_in_gitignore_lines(gitignore_lines, "folder.egg-info/")
+        assert not path_is_in_gitignore_lines(gitignore_lines, "folder.egg-info")
+        # with a suffix only an existing directory counts as one
+        (tmp_path / "pkg.egg-info").mkdir()
+        assert path_is_in_gitignore_lines(gitignore_lines, "pkg.egg-info")
+        # without a suffix only an existing file is not a directory
+        (tmp_path / "build_file").write_text("")
+        assert not path_is_in_gitignore_lines(
+            [*gitignore_lines, "build_file/"], "build_file"
+        )
+        spy_isfile = mocker.spy(os.path, "isfile")
+        spy_isdir = mocker.spy(os.path, "isdir")
+        path_is_in_gitignore_lines(gitignore_lines, "build/")
+        assert spy_isfile.call_count == spy_isdir.call_count == 0, "Expected no stat"
+        path_is_in_gitignore_lines(gitignore_lines, "build")
+        assert spy_isfile.call_count + spy_isdir.call_count == 1, "Expected one stat"
+
+        # Path objects and absolute paths take the full Path route
+        assert path_is_in_gitignore_lines(gitignore_lines, Path("dist/file.py"))
+        assert path_is_in_gitignore_lines(gitignore_lines, tmp_path / "x.pyc")
+        assert not path_is_in_gitignore_lines(gitignore_lines, tmp_path / "x.py")
+
+
+def test_paths_in_gitignore_lines() -> None:
+    """Test func for paths_in_gitignore_lines."""
+    ignored = paths_in_gitignore_lines(
+        ["*.pyc", "build/", "!keep.pyc"],
+        ["a.pyc", "keep.pyc", "build/", "build/x.py", "src/", "src/a.py"],
+    )
+    assert ignored == {"a.pyc", "build/", "build/x.py"}, (
+        f"Expected only ignored paths, got {ignored}"
+    )
+
+
+def test_as_gitignore_key() -> None:
+    """Test func for as_gitignore_key."""
+    lines = ("*.pyc", "build/")
+    assert as_gitignore_key(lines) is lines, "Expected tuple passed through"
+    assert as_gitignore_key(list(lines)) == lines, "Expected list as tuple"
+
 
 def test_load_gitignore(tmp_path: Path) -> None:
     """Test function."""
@@ -158,4 +372,4 @@ dist/
 .pytest_cache/
 """
         GITIGNORE_PATH.write_text(content)
-        assert load_gitignore() == content.splitlines()
+        assert load_gitignore() == tuple(content.splitlines())
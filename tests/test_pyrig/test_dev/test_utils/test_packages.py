@@ -3,6 +3,7 @@
 from contextlib import chdir
 from pathlib import Path
 
+import pytest
 from pytest_mock import MockFixture
 
 import pyrig
@@ -12,7 +13,11 @@ from pyrig.dev.utils.git import path_is_in_gitignore_lines
 from pyrig.dev.utils.packages import (
     find_packages,
     get_namespace_packages,
+    get_package_depth_pattern,
     get_src_package,
+    get_src_package_name,
+    is_regular_package,
+    load_gitignore_package_excludes,
     src_pkg_is_pyrig,
 )
 from pyrig.src.modules.module import make_obj_importpath
@@ -24,7 +29,25 @@ def test_get_src_package() -> None:
     assert src_pkg.__name__ == pyrig.__name__, f"Expected pyrig, got {src_pkg}"
 
 
-def test_find_packages(mocker: MockFixture) -> None:
+def test_get_src_package_name(tmp_path: Path) -> None:
+    """Test func for get_src_package_name."""
+    assert get_src_package_name(Path.cwd()) == pyrig.__name__
+    with chdir(tmp_path):
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "__init__.py").write_text("")
+        (tmp_path / "my_pkg").mkdir()
+        (tmp_path / "my_pkg" / "__init__.py").write_text("")
+        name = get_src_package_name(tmp_path)
+        assert name == "my_pkg", f"Expected my_pkg, got {name}"
+        # cached per directory, the walk is not repeated
+        (tmp_path / "my_pkg" / "__init__.py").unlink()
+        assert get_src_package_name(tmp_path) == "my_pkg", "Expected cached name"
+        get_src_package_name.cache_clear()
+        with pytest.raises(ModuleNotFoundError):
+            get_src_package_name(tmp_path)
+
+
+def test_find_packages(mocker: MockFixture, tmp_path: Path) -> None:
     """Test func for find_packages."""
     # Mock setuptools find_packages
     mock_find_packages = mocker.patch(
@@ -32,51 +55,57 @@ def test_find_packages(mocker: MockFixture) -> None:
         return_value=["package1", "package1.sub1", "package1.sub1.sub2", "package2"],
     )
 
-    # Mock read_text of Path to return empty list (no gitignore patterns)
-    mocker.patch(
-        "pathlib.Path.read_text",
-        return_value="",
-    )
+    # empty gitignore, so no gitignore patterns
+    with chdir(tmp_path):
+        Path(".gitignore").write_text("")
 
-    # Test without depth limit
-    result = find_packages()
-    expected = ["package1", "package1.sub1", "package1.sub1.sub2", "package2"]
-    assert result == expected, f"Expected {expected}, got {result}"
+        # Test without depth limit
+        result = find_packages()
+        expected = ["package1", "package1.sub1", "package1.sub1.sub2", "package2"]
+        assert result == expected, f"Expected {expected}, got {result}"
 
-    # Test with depth limit
-    result = find_packages(depth=1)
-    expected = ["package1", "package1.sub1", "package2"]
-    assert result == expected, f"Expected {expected}, got {result}"
+        # Test with depth limit
+        result = find_packages(depth=1)
+        expected = ["package1", "package1.sub1", "package2"]
+        assert result == expected, f"Expected {expected}, got {result}"
 
-    # Test with depth 0
-    result = find_packages(depth=0)
-    expected = ["package1", "package2"]
-    assert result == expected, f"Expected {expected}, got {result}"
+        # Test with depth 0
+        result = find_packages(depth=0)
+        expected = ["package1", "package2"]
+        assert result == expected, f"Expected {expected}, got {result}"
 
     # Verify that setuptools find_packages was called with empty exclude list
     mock_find_packages.assert_called_with(where=".", exclude=[], include=("*",))
 
 
-def test_find_packages_with_namespace(mocker: MockFixture) -> None:
+def test_get_package_depth_pattern() -> None:
+    """Test func for get_package_depth_pattern."""
+    pattern = get_package_depth_pattern(1)
+    assert pattern.fullmatch("pkg"), "Expected top-level package to match"
+    assert pattern.fullmatch("pkg.sub"), "Expected depth 1 package to match"
+    assert not pattern.fullmatch("pkg.sub.deep"), "Expected depth 2 to not match"
+    assert get_package_depth_pattern(1) is pattern, "Expected cached pattern"
+
+
+def test_find_packages_with_namespace(mocker: MockFixture, tmp_path: Path) -> None:
     """Test find_packages with namespace packages."""
     mock_find_namespace = mocker.patch(
         make_obj_importpath(packages) + "._find_namespace_packages",
         return_value=["ns_package1", "ns_package2"],
     )
 
-    mocker.patch(
-        "pathlib.Path.read_text",
-        return_value="",
-    )
-
-    result = find_packages(include_namespace_packages=True)
+    # no gitignore at all, so no gitignore patterns
+    with chdir(tmp_path):
+        result = find_packages(include_namespace_packages=True)
     expected = ["ns_package1", "ns_package2"]
     assert result == expected, f"Expected {expected}, got {result}"
 
     mock_find_namespace.assert_called_once_with(where=".", exclude=[], include=("*",))
 
 
-def test_find_packages_with_gitignore_filtering(mocker: MockFixture) -> None:
+def test_find_packages_with_gitignore_filtering(
+    mocker: MockFixture, tmp_path: Path
+) -> None:
     """Test find_packages with gitignore patterns that should exclude packages."""
     # Mock setuptools find_packages to return only packages not excluded by gitignore
     mock_find_packages = mocker.patch(
@@ -87,22 +116,26 @@ def test_find_packages_with_gitignore_filtering(mocker: MockFixture) -> None:
         ],  # dist and build are excluded by setuptools
     )
 
-    # Mock load_gitignore to return patterns that should exclude dist and build
-    mocker.patch(
-        "pathlib.Path.read_text",
-        return_value="""
+    # gitignore with patterns that should exclude dist and build
+    with chdir(tmp_path):
+        Path(".gitignore").write_text("""
 dist/
 build/
 __pycache__/
-""",
-    )
-
-    result = find_packages()
+""")
+        result = find_packages()
     expected = ["package1", "package2"]
     assert result == expected, f"Expected {expected}, got {result}"
 
     # Verify that setuptools find_packages was called with gitignore patterns
-    expected_exclude = ["dist", "build", "__pycache__"]
+    expected_exclude = [
+        "dist",
+        "dist.*",
+        "build",
+        "build.*",
+        "__pycache__",
+        "__pycache__.*",
+    ]
     mock_find_packages.assert_called_with(
         where=".", exclude=expected_exclude, include=("*",)
     )
@@ -128,7 +161,42 @@ def test_get_namespace_packages(tmp_path: Path) -> None:
         (Path.cwd() / "dist").mkdir()
         assert get_namespace_packages() == []
 
+        # ignored directories are pruned, not just filtered at the top level
+        (Path.cwd() / "dist" / "nested").mkdir()
+        assert get_namespace_packages() == []
+
 
-def test_src_pkg_is_pyrig() -> None:
+def test_src_pkg_is_pyrig(tmp_path: Path) -> None:
     """Test function."""
     assert src_pkg_is_pyrig()
+    with chdir(tmp_path):
+        assert not src_pkg_is_pyrig(), "Expected False without pyrig package"
+        (tmp_path / "pyrig").mkdir()
+        (tmp_path / "pyrig" / "__init__.py").write_text("")
+        assert src_pkg_is_pyrig(), "Expected True with pyrig package"
+
+
+def test_load_gitignore_package_excludes(tmp_path: Path) -> None:
+    """Test func for load_gitignore_package_excludes."""
+    gitignore = tmp_path / ".gitignore"
+    gitignore.write_text("# caches/\n*.pyc\nbuild/\n!keep/\nsrc/gen/\n")
+    mtime_ns = gitignore.stat().st_mtime_ns
+    excludes = load_gitignore_package_excludes(str(gitignore), mtime_ns)
+    expected = ("build", "build.*", "src.gen", "src.gen.*")
+    assert excludes == expected, f"Expected {expected}, got {excludes}"
+    assert load_gitignore_package_excludes(str(gitignore), mtime_ns) is excludes, (
+        "Expected cached excludes for unchanged file"
+    )
+
+
+def test_is_regular_package(tmp_path: Path) -> None:
+    """Test func for is_regular_package."""
+    with chdir(tmp_path):
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "pkg" / "sub" / "__init__.py").write_text("")
+        assert not is_regular_package("pkg"), "Expected pkg without init"
+        assert not is_regular_package("pkg.sub"), "Expected parent without init"
+        (tmp_path / "pkg" / "__init__.py").write_text("")
+        assert is_regular_package("pkg"), "Expected pkg with init"
+        assert is_regular_package("pkg.sub"), "Expected full init chain"
+    assert is_regular_package("pkg.sub", where=str(tmp_path)), "Expected where root"
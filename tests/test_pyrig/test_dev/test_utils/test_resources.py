@@ -2,14 +2,19 @@
 
 from pathlib import Path
 
+import pytest
 from pytest_mock import MockFixture
 from requests import RequestException
 
 from pyrig.dev.utils import resources
+from pyrig.dev.utils.packages import src_pkg_is_pyrig
 from pyrig.dev.utils.resources import (
+    read_resource_content,
     return_resource_content_on_fetch_error,
     return_resource_file_content_on_exceptions,
+    wrap_with_resource_fallback,
 )
+from pyrig.src.git import git_add_file
 from pyrig.src.resource import get_resource_path
 
 
@@ -35,6 +40,58 @@ def test_return_resource_file_content_on_exceptions(
     # now test_func should return "Hello World!" instead of raising ValueError
     assert test_func() == "Hello World!"
 
+    # extra tenacity arguments go through tenacity with the same fallback
+    before_calls: list[object] = []
+
+    @return_resource_file_content_on_exceptions(
+        "test_resource.txt", (ValueError,), before=before_calls.append
+    )
+    def test_func_tenacity() -> str:
+        msg = "Test exception"
+        raise ValueError(msg)
+
+    assert test_func_tenacity() == "Hello World!"
+    assert len(before_calls) == 1, "Expected tenacity to run once"
+
+    # without overwrite the dev mode check is never made
+    mock_src_pkg_is_pyrig = mocker.patch(
+        resources.__name__ + "." + src_pkg_is_pyrig.__name__
+    )
+
+    @return_resource_file_content_on_exceptions(
+        "test_resource.txt", (ValueError,), overwrite_resource=False
+    )
+    def test_func_read_only() -> str:
+        return " Fresh content "
+
+    assert test_func_read_only() == "Fresh content"
+    mock_src_pkg_is_pyrig.assert_not_called()
+    assert resource_path.read_text() == "Hello World!"
+
+    # in dev mode a changed result replaces the resource file
+    mock_src_pkg_is_pyrig.return_value = True
+    mock_git_add_file = mocker.patch(resources.__name__ + "." + git_add_file.__name__)
+
+    @return_resource_file_content_on_exceptions("test_resource.txt", (ValueError,))
+    def test_func_fresh() -> str:
+        return "Fresh content\n"
+
+    assert test_func_fresh() == "Fresh content"
+    assert resource_path.read_text() == "Fresh content"
+    assert list(tmp_path.iterdir()) == [resource_path], "Expected no temp file"
+    mock_git_add_file.assert_called_once_with(resource_path)
+
+    # the resource is not read at decoration time
+    resource_path.unlink()
+
+    @return_resource_file_content_on_exceptions(
+        "test_resource.txt", (ValueError,), overwrite_resource=False
+    )
+    def test_func_lazy() -> str:
+        return "Lazy content"
+
+    assert test_func_lazy() == "Lazy content"
+
 
 def test_return_resource_content_on_fetch_error(
     tmp_path: Path, mocker: MockFixture
@@ -56,3 +113,35 @@ def test_return_resource_content_on_fetch_error(
 
     # now test_func should return "Hello World!" instead of raising ValueError
     assert test_func() == "Hello World!"
+
+
+def test_read_resource_content(tmp_path: Path) -> None:
+    """Test function."""
+    resource_path = tmp_path / "test_resource.txt"
+    resource_path.write_text("  Hello World!\n")
+    assert read_resource_content(resource_path) == "Hello World!"
+    # cached, the file is not read again
+    resource_path.write_text("Changed")
+    assert read_resource_content(resource_path) == "Hello World!"
+    read_resource_content.cache_clear()
+    assert read_resource_content(resource_path) == "Changed"
+
+
+def test_wrap_with_resource_fallback(tmp_path: Path) -> None:
+    """Test function."""
+    resource_path = tmp_path / "test_fallback.txt"
+    resource_path.write_text("Fallback")
+
+    def failing() -> str:
+        msg = "Test exception"
+        raise ValueError(msg)
+
+    wrapped = wrap_with_resource_fallback(failing, resource_path, (ValueError,))
+    assert wrapped() == "Fallback"
+    wrapped = wrap_with_resource_fallback(
+        failing, resource_path, (ValueError,), before=lambda _state: None
+    )
+    assert wrapped() == "Fallback"
+    wrapped = wrap_with_resource_fallback(failing, resource_path, (KeyError,))
+    with pytest.raises(ValueError, match="Test exception"):
+        wrapped()
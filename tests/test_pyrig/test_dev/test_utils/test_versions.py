@@ -1,8 +1,22 @@
 """module."""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
 from packaging.version import Version
 
-from pyrig.dev.utils.versions import VersionConstraint, adjust_version_to_level
+from pyrig.dev.utils.versions import (
+    ParsedVersionConstraint,
+    VersionConstraint,
+    adjust_version_to_level,
+    bump_micro_version,
+    generate_version_range,
+    get_component_range,
+    get_previous_release_version,
+    get_release_version,
+    parse_version,
+    parse_version_constraint,
+)
 
 
 def test_adjust_version_to_level() -> None:
@@ -21,6 +35,118 @@ def test_adjust_version_to_level() -> None:
     assert str(new_version) == "3.8"
 
 
+def test_parse_version() -> None:
+    """Test func for parse_version."""
+    version = parse_version("3.11")
+    assert version == Version("3.11"), f"Expected 3.11, got {version}"
+    assert parse_version("3.11") is version, "Expected interned version"
+
+
+def test_get_release_version() -> None:
+    """Test func for get_release_version."""
+    version = get_release_version(3, 11)
+    assert str(version) == "3.11", f"Expected 3.11, got {version}"
+    assert get_release_version(3, 11) is version, "Expected cached version"
+    version = get_release_version(3)
+    assert str(version) == "3", f"Expected 3, got {version}"
+
+
+def test_get_previous_release_version() -> None:
+    """Test func for get_previous_release_version."""
+    cases = [((3, 12, 5), "3.12.4"), ((3, 12, 0), "3.11"), ((4, 0, 0), "3")]
+    for components, expected in cases:
+        version = get_previous_release_version(*components)
+        assert str(version) == expected, f"Expected {expected}, got {version}"
+
+
+def test_bump_micro_version() -> None:
+    """Test func for bump_micro_version."""
+    version = bump_micro_version(3, 11, 5)
+    assert version == Version("3.11.6"), f"Expected 3.11.6, got {version}"
+    assert bump_micro_version(3, 11, 5) is version, "Expected cached version"
+
+
+def test_generate_version_range() -> None:
+    """Test func for generate_version_range."""
+    versions = generate_version_range(">=3.8,<3.12", "minor", None, None)
+    expected = tuple(Version(x) for x in ["3.8", "3.9", "3.10", "3.11"])
+    assert versions == expected, f"Expected {expected}, got {versions}"
+    assert generate_version_range(">=3.8,<3.12", "minor", None, None) is versions, (
+        "Expected cached range"
+    )
+    with pytest.raises(ValueError, match="No lower or upper bound"):
+        generate_version_range(">=3.8", "minor", None, None)
+
+
+def test_get_component_range() -> None:
+    """Test func for get_component_range."""
+    result = get_component_range(8, 11)
+    assert result == range(8, 12), f"Expected range(8, 12), got {result}"
+    # upper component smaller than lower, e.g. minor of 3.12 to 4.1
+    result = get_component_range(12, 1)
+    assert result == range(24), f"Expected range(24), got {result}"
+
+
+def test_parse_version_constraint() -> None:
+    """Test func for parse_version_constraint."""
+    parsed = parse_version_constraint(">3.8,<=3.12")
+    assert isinstance(parsed, ParsedVersionConstraint), f"Got {type(parsed)}"
+    assert str(parsed.sset) == "<=3.12,>3.8", f"Expected <=3.12,>3.8, got {parsed}"
+    assert parsed.lower_inclusive == Version("3.8.1"), f"Got {parsed}"
+    assert parsed.upper_exclusive == Version("3.12.1"), f"Got {parsed}"
+    assert parsed.simple_bounds_only, "Expected only simple bounds"
+    assert parsed.excluded_versions == frozenset(), f"Expected none, got {parsed}"
+    assert parse_version_constraint(">3.8,<=3.12") is parsed, "Expected cached"
+
+
+class TestParsedVersionConstraint:
+    """Test class."""
+
+    def test___init__(self) -> None:
+        """Test method for __init__."""
+        parsed = parse_version_constraint(">=3.8,<3.12")
+        assert parsed.lowers_inclusive == (Version("3.8"),), f"Got {parsed}"
+        assert parsed.uppers_exclusive == (Version("3.12"),), f"Got {parsed}"
+        assert not hasattr(parsed, "__dict__"), "Expected slots only"
+
+    def test___repr__(self) -> None:
+        """Test method for __repr__."""
+        result = repr(parse_version_constraint(">=3.8"))
+        assert result.startswith("ParsedVersionConstraint(sset="), f"Got {result}"
+
+    def test___eq__(self) -> None:
+        """Test method for __eq__."""
+        parse_version_constraint.cache_clear()
+        first = parse_version_constraint(">=3.8")
+        parse_version_constraint.cache_clear()
+        second = parse_version_constraint(">=3.8")
+        assert first is not second, "Expected a fresh parse after cache_clear"
+        assert first == second, "Expected equal parse results"
+        assert first != parse_version_constraint(">=3.9"), "Expected different"
+
+    def test___hash__(self) -> None:
+        """Test method for __hash__."""
+        parse_version_constraint.cache_clear()
+        first = parse_version_constraint(">=3.8,!=3.10")
+        parse_version_constraint.cache_clear()
+        second = parse_version_constraint(">=3.8,!=3.10")
+        assert hash(first) == hash(second), "Expected equal hashes for equal results"
+
+    def test___setattr__(self) -> None:
+        """Test method for __setattr__."""
+        parsed = parse_version_constraint(">=3.8")
+        field_name = "simple_bounds_only"
+        with pytest.raises(FrozenInstanceError):
+            setattr(parsed, field_name, False)
+
+    def test___delattr__(self) -> None:
+        """Test method for __delattr__."""
+        parsed = parse_version_constraint(">=3.8")
+        field_name = "sset"
+        with pytest.raises(FrozenInstanceError):
+            delattr(parsed, field_name)
+
+
 class TestVersionConstraint:
     """Test class."""
 
@@ -31,6 +157,68 @@ class TestVersionConstraint:
         assert version_constraint.constraint == constraint, (
             f"Expected {constraint}, got {version_constraint.constraint}"
         )
+        assert not hasattr(version_constraint, "__dict__"), "Expected slots only"
+        for quoted in (' ">=3.8, <3.12" ', "'>=3.8, <3.12'", "\"'>=3.8, <3.12'\""):
+            spec = VersionConstraint(quoted).spec
+            assert spec == constraint, f"Expected {constraint}, got {spec}"
+
+    def test_lowers_inclusive(self) -> None:
+        """Test method for lowers_inclusive."""
+        version_constraint = VersionConstraint(">=3.8, >3.9, <=3.12, <3.13")
+        result = version_constraint.lowers_inclusive
+        expected = [Version("3.8"), Version("3.9.1")]
+        assert result == expected, f"Expected {expected}, got {result}"
+        result.clear()
+        assert version_constraint.lowers_inclusive == expected, "Expected fresh list"
+
+    def test_lowers_exclusive(self) -> None:
+        """Test method for lowers_exclusive."""
+        version_constraint = VersionConstraint(">=3.8, >3.9, <=3.12, <3.13")
+        result = version_constraint.lowers_exclusive
+        expected = [Version("3.9")]
+        assert result == expected, f"Expected {expected}, got {result}"
+        result.clear()
+        assert version_constraint.lowers_exclusive == expected, "Expected fresh list"
+
+    def test_lowers_exclusive_to_inclusive(self) -> None:
+        """Test method for lowers_exclusive_to_inclusive."""
+        version_constraint = VersionConstraint(">=3.8, >3.9, <=3.12, <3.13")
+        result = version_constraint.lowers_exclusive_to_inclusive
+        expected = [Version("3.9.1")]
+        assert result == expected, f"Expected {expected}, got {result}"
+        result.clear()
+        assert version_constraint.lowers_exclusive_to_inclusive == expected, (
+            "Expected fresh list"
+        )
+
+    def test_uppers_inclusive(self) -> None:
+        """Test method for uppers_inclusive."""
+        version_constraint = VersionConstraint(">=3.8, >3.9, <=3.12, <3.13")
+        result = version_constraint.uppers_inclusive
+        expected = [Version("3.12")]
+        assert result == expected, f"Expected {expected}, got {result}"
+        result.clear()
+        assert version_constraint.uppers_inclusive == expected, "Expected fresh list"
+
+    def test_uppers_exclusive(self) -> None:
+        """Test method for uppers_exclusive."""
+        version_constraint = VersionConstraint(">=3.8, >3.9, <=3.12, <3.13")
+        result = version_constraint.uppers_exclusive
+        expected = [Version("3.12.1"), Version("3.13")]
+        assert result == expected, f"Expected {expected}, got {result}"
+        result.clear()
+        assert version_constraint.uppers_exclusive == expected, "Expected fresh list"
+
+    def test_uppers_inclusive_to_exclusive(self) -> None:
+        """Test method for uppers_inclusive_to_exclusive."""
+        version_constraint = VersionConstraint(">=3.8, >3.9, <=3.12, <3.13")
+        result = version_constraint.uppers_inclusive_to_exclusive
+        expected = [Version("3.12.1")]
+        assert result == expected, f"Expected {expected}, got {result}"
+        result.clear()
+        assert version_constraint.uppers_inclusive_to_exclusive == expected, (
+            "Expected fresh list"
+        )
 
     def test_get_lower_inclusive(self) -> None:
         """Test method for get_lower_inclusive."""
@@ -53,6 +241,9 @@ class TestVersionConstraint:
         lower = version_constraint.get_lower_inclusive("3.8")
         expected = "3.8"
         assert str(lower) == expected, f"Expected {expected}, got {lower}"
+        default = Version("3.9")
+        lower = version_constraint.get_lower_inclusive(default)
+        assert lower is default, f"Expected default version, got {lower}"
 
     def test_get_upper_exclusive(self) -> None:
         """Test method for get_upper_exclusive."""
@@ -97,6 +288,9 @@ class TestVersionConstraint:
         version_constraint = VersionConstraint(constraint)
         upper = version_constraint.get_upper_inclusive()
         assert upper is None, f"Expected None, got {upper}"
+        upper = version_constraint.get_upper_inclusive("3.13")
+        expected = "3.13.0"
+        assert str(upper) == expected, f"Expected {expected}, got {upper}"
 
         constraint = ">=2.8, <3.12.0"
         version_constraint = VersionConstraint(constraint)
@@ -109,10 +303,10 @@ class TestVersionConstraint:
         constraint = ">=3, <3.12"
         version_constraint = VersionConstraint(constraint)
         versions = version_constraint.get_version_range(level="major")
-        expected = [Version("3")]
+        expected = (Version("3"),)
         assert versions == expected, f"Expected {expected}, got {versions}"
         versions = version_constraint.get_version_range(level="minor")
-        expected = [
+        expected = tuple(
             Version(x)
             for x in [
                 "3.0",
@@ -128,12 +322,12 @@ class TestVersionConstraint:
                 "3.10",
                 "3.11",
             ]
-        ]
+        )
         assert versions == expected, f"Expected {expected}, got {versions}"
         constraint = ">=3.8.2, <3.9.6"
         version_constraint = VersionConstraint(constraint)
         versions = version_constraint.get_version_range(level="micro")
-        expected = [
+        expected = tuple(
             Version(x)
             for x in [
                 "3.8.2",
@@ -145,7 +339,7 @@ class TestVersionConstraint:
                 "3.9.4",
                 "3.9.5",
             ]
-        ]
+        )
         assert versions == expected, f"Expected {expected}, got {versions}"
 
         constraint = ">=3.12"
@@ -153,7 +347,7 @@ class TestVersionConstraint:
         versions = version_constraint.get_version_range(
             level="minor", upper_default="3.14.0"
         )
-        expected = [Version(x) for x in ["3.12", "3.13", "3.14"]]
+        expected = tuple(Version(x) for x in ["3.12", "3.13", "3.14"])
         assert versions == expected, f"Expected {expected}, got {versions}"
 
         # what if the micro or minor is smaller in lower than upper
@@ -161,7 +355,7 @@ class TestVersionConstraint:
         constraint = ">=3.12, <4.1"
         version_constraint = VersionConstraint(constraint)
         versions = version_constraint.get_version_range(level="minor")
-        expected = [
+        expected = tuple(
             Version(x)
             for x in [
                 "3.12",
@@ -179,13 +373,13 @@ class TestVersionConstraint:
                 "3.24",
                 "4.0",
             ]
-        ]
+        )
         assert versions == expected, f"Expected {expected}, got {versions}"
 
         constraint = ">=3.11.7, <3.12.2"
         version_constraint = VersionConstraint(constraint)
         versions = version_constraint.get_version_range(level="micro")
-        expected = [
+        expected = tuple(
             Version(x)
             for x in [
                 "3.11.7",
@@ -198,5 +392,47 @@ class TestVersionConstraint:
                 "3.12.0",
                 "3.12.1",
             ]
-        ]
+        )
+        assert versions == expected, f"Expected {expected}, got {versions}"
+
+        # plain exclusions are filtered by set lookup, zero padded like !=
+        constraint = ">=3.8, <3.12, !=3.10, !=3.9.0"
+        version_constraint = VersionConstraint(constraint)
+        assert version_constraint.simple_bounds_only
+        versions = version_constraint.get_version_range(level="minor")
+        expected = tuple(Version(x) for x in ["3.8", "3.11"])
+        assert versions == expected, f"Expected {expected}, got {versions}"
+
+        # wildcard exclusions are filtered through the specifier set
+        constraint = ">=3.8, <3.12, !=3.10.*"
+        version_constraint = VersionConstraint(constraint)
+        assert not version_constraint.simple_bounds_only
+        versions = version_constraint.get_version_range(level="minor")
+        expected = tuple(Version(x) for x in ["3.8", "3.9", "3.11"])
+        assert versions == expected, f"Expected {expected}, got {versions}"
+
+        # pre-release bounds too
+        constraint = ">=3.13.0rc1, <3.13.2"
+        version_constraint = VersionConstraint(constraint)
+        assert not version_constraint.simple_bounds_only
+        versions = version_constraint.get_version_range(level="micro")
+        expected = tuple(Version(x) for x in ["3.13.0", "3.13.1"])
+        assert versions == expected, f"Expected {expected}, got {versions}"
+
+    def test_get_version_range_with_epochs(self) -> None:
+        """Test get_version_range with epoch bounds and exclusions."""
+        # epochs are dropped by the micro bump, so they take the specifier set
+        # path too, every 3.x release sorts before 1!3.9
+        constraint = ">1!3.9"
+        version_constraint = VersionConstraint(constraint)
+        assert not version_constraint.simple_bounds_only
+        versions = version_constraint.get_version_range(
+            level="minor", lower_default="3.8", upper_default="3.13"
+        )
+        assert versions == (), f"Expected no versions, got {versions}"
+        constraint = ">=3.8, <3.12, !=1!3.10"
+        version_constraint = VersionConstraint(constraint)
+        assert not version_constraint.simple_bounds_only
+        versions = version_constraint.get_version_range(level="minor")
+        expected = tuple(Version(x) for x in ["3.8", "3.9", "3.10", "3.11"])
         assert versions == expected, f"Expected {expected}, got {versions}"
@@ -1,6 +1,11 @@
 """module."""
 
-from pyrig.src.cli import get_pkg_name_from_argv, get_project_name_from_argv
+from pyrig.src.cli import (
+    get_pkg_name_from_argv,
+    get_pkg_name_from_script,
+    get_project_name_from_argv,
+    get_project_name_from_script,
+)
 
 
 def test_get_project_name_from_argv() -> None:
@@ -13,3 +18,15 @@ def test_get_pkg_name_from_argv() -> None:
     """Test function."""
     result = get_pkg_name_from_argv()
     assert isinstance(result, str), "Expected string result"
+
+
+def test_get_project_name_from_script() -> None:
+    """Test function."""
+    result = get_project_name_from_script("/venv/bin/my-project")
+    assert result == "my-project", f"Expected my-project, got {result}"
+
+
+def test_get_pkg_name_from_script() -> None:
+    """Test function."""
+    result = get_pkg_name_from_script("/venv/bin/my-project")
+    assert result == "my_project", f"Expected my_project, got {result}"
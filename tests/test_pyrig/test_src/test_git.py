@@ -3,12 +3,18 @@
 import os
 from pathlib import Path
 
+import pytest
+from pytest_mock import MockFixture
+
 import pyrig
+from pyrig.src import git
 from pyrig.src.git import (
+    find_git_config_path,
     get_codecov_url_from_git,
     get_git_unstaged_changes,
     get_git_username,
     get_github_pages_url_from_git,
+    get_global_git_config_paths,
     get_licence_badge_url_from_git,
     get_pypi_badge_url_from_git,
     get_pypi_url_from_git,
@@ -18,8 +24,51 @@ from pyrig.src.git import (
     get_workflow_badge_url_from_git,
     get_workflow_run_url_from_git,
     git_add_file,
+    read_git_config_value,
+    reset_git_caches,
     running_in_github_actions,
 )
+from pyrig.src.modules.module import make_obj_importpath
+from pyrig.src.processes import run_subprocess
+
+
+def test_find_git_config_path(tmp_path: Path) -> None:
+    """Test func for find_git_config_path."""
+    assert find_git_config_path(tmp_path) is None, "Expected no repository"
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").write_text("")
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    config_path = find_git_config_path(tmp_path / "pkg" / "sub")
+    expected = tmp_path / ".git" / "config"
+    assert config_path == expected, f"Expected {expected}, got {config_path}"
+
+    worktree = tmp_path / "pkg"
+    (worktree / ".git").write_text("gitdir: elsewhere")
+    assert find_git_config_path(worktree / "sub") is None, "Expected worktree None"
+
+
+def test_read_git_config_value(tmp_path: Path) -> None:
+    """Test func for read_git_config_value."""
+    config_path = tmp_path / "config"
+    config_path.write_text(
+        "[core]\n\tbare = false\n\tsymlinks\n"
+        '[remote "origin"]\n\turl = git@github.com:owner/repo.git ; comment\n'
+        '[user]\n\tname = "Some Name"\n'
+    )
+    url = read_git_config_value(config_path, 'remote "origin"', "url")
+    expected = "git@github.com:owner/repo.git"
+    assert url == expected, f"Expected {expected}, got {url}"
+    name = read_git_config_value(config_path, "user", "name")
+    assert name == "Some Name", f"Expected Some Name, got {name}"
+    assert read_git_config_value(config_path, "user", "email") == "", "Expected empty"
+    missing = tmp_path / "missing"
+    assert read_git_config_value(missing, "user", "name") == "", "Expected empty"
+    # an included file may override the value, only git can resolve it
+    config_path.write_text(
+        '[user]\n\tname = Personal\n[includeIf "gitdir:~/work/"]\n\tpath = work\n'
+    )
+    name = read_git_config_value(config_path, "user", "name")
+    assert name is None, f"Expected None for config with includes, got {name}"
 
 
 def test_get_repo_remote_from_git() -> None:
@@ -30,16 +79,39 @@ def test_get_repo_remote_from_git() -> None:
     assert "github.com" in url, f"Expected 'github.com' in url, got {url}"
 
 
-def test_get_repo_owner_and_name_from_git() -> None:
+def test_get_repo_owner_and_name_from_git(mocker: MockFixture) -> None:
     """Test func for get_repo_owner_and_name_from_git."""
     owner, repo = get_repo_owner_and_name_from_git()
     assert isinstance(owner, str), f"Expected owner to be str, got {type(owner)}"
 
     assert owner == "Winipedia", f"Expected owner to be 'Winipedia', got {owner}"
     assert repo == pyrig.__name__, f"Expected repo to be 'pyrig', got {repo}"
+    assert get_repo_owner_and_name_from_git() == (owner, repo), "Expected cached"
+
+    # ssh remote with trailing slash, parsed by the pre-compiled pattern
+    mocker.patch(
+        make_obj_importpath(git) + ".get_repo_remote_from_git",
+        return_value="git@github.com:some-owner/some.repo.git/",
+    )
+    reset_git_caches()
+    result = get_repo_owner_and_name_from_git()
+    assert result == ("some-owner", "some.repo"), f"Got {result}"
+    reset_git_caches()
 
 
-def test_get_git_username() -> None:
+def test_reset_git_caches() -> None:
+    """Test func for reset_git_caches."""
+    get_repo_owner_and_name_from_git()
+    url = get_repo_url_from_git()
+    assert get_repo_url_from_git() is url, "Expected cached url"
+    reset_git_caches()
+    assert get_repo_url_from_git.cache_info().currsize == 0, "Expected cleared urls"
+    info = get_repo_owner_and_name_from_git.cache_info()
+    assert info.currsize == 0, f"Expected empty cache, got {info}"
+    assert get_repo_remote_from_git.cache_info().currsize == 0, "Expected cleared"
+
+
+def test_get_git_username(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """Test function."""
     username = get_git_username()
     assert isinstance(username, str), (
@@ -47,6 +119,55 @@ def test_get_git_username() -> None:
     )
     assert len(username) > 0, "Expected username to be non-empty"
 
+    # GIT_CONFIG_GLOBAL replaces ~/.gitconfig, like it does for git itself
+    global_config = tmp_path / "gitconfig"
+    global_config.write_text("[user]\n\tname = ci-user\n")
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.chdir(tmp_path)
+    reset_git_caches()
+    try:
+        username = get_git_username()
+    finally:
+        monkeypatch.undo()
+        reset_git_caches()
+    assert username == "ci-user", f"Expected ci-user, got {username}"
+
+
+def test_get_git_username_with_include_if(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an includeIf override of user.name is resolved like git."""
+    work_repo = tmp_path.resolve() / "work"
+    run_subprocess(["git", "init", "-q", str(work_repo)])
+    work_config = tmp_path / "work.gitconfig"
+    work_config.write_text("[user]\n\tname = Work\n")
+    global_config = tmp_path / "gitconfig"
+    global_config.write_text(
+        "[user]\n\tname = Personal\n"
+        f'[includeIf "gitdir:{work_repo.as_posix()}/"]\n\tpath = {work_config}\n'
+    )
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    monkeypatch.chdir(work_repo)
+    reset_git_caches()
+    try:
+        username = get_git_username()
+    finally:
+        monkeypatch.undo()
+        reset_git_caches()
+    assert username == "Work", f"Expected included Work, got {username}"
+
+
+def test_get_global_git_config_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test func for get_global_git_config_paths."""
+    monkeypatch.delenv("GIT_CONFIG_GLOBAL", raising=False)
+    monkeypatch.setenv("XDG_CONFIG_HOME", "/xdg")
+    paths = get_global_git_config_paths()
+    expected = (Path.home() / ".gitconfig", Path("/xdg/git/config"))
+    assert paths == expected, f"Expected {expected}, got {paths}"
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", "/ci/gitconfig")
+    paths = get_global_git_config_paths()
+    assert paths == (Path("/ci/gitconfig"),), f"Expected only override, got {paths}"
+
 
 def test_get_git_unstaged_changes() -> None:
     """Test function."""
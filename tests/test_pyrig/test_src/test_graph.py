@@ -107,6 +107,51 @@ class TestDiGraph:
         # Ancestors of non-existent node
         assert graph.ancestors("x") == set()
 
+        # cached results are copied, modifying one does not affect the cache
+        graph.ancestors("d").add("x")
+        assert graph.ancestors("d") == {"a", "b", "c", "e"}
+
+        # adding an edge invalidates the cached ancestors
+        graph.add_edge("f", "a")
+        assert graph.ancestors("d") == {"a", "b", "c", "e", "f"}
+
+    def test_ancestors_many(self) -> None:
+        """Test finding the combined ancestors of several nodes."""
+        graph = DiGraph()
+        # Build graph: a -> b -> c -> d
+        #              e -> c, f -> g
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "c")
+        graph.add_edge("c", "d")
+        graph.add_edge("e", "c")
+        graph.add_edge("f", "g")
+
+        result = graph.ancestors_many(["b", "g"])
+        assert result == {"a", "f"}, f"Expected a and f, got {result}"
+        result = graph.ancestors_many(["c", "d"])
+        assert result == {"a", "b", "c", "e"}, f"Expected c included, got {result}"
+        assert graph.ancestors_many(["x"]) == set(), "Expected unknown node ignored"
+        assert graph.ancestors_many([]) == set(), "Expected empty result"
+
+    def test_all_ancestors(self) -> None:
+        """Test finding the ancestors of all nodes at once."""
+        graph = DiGraph()
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "c")
+        graph.add_edge("c", "d")
+        graph.add_edge("e", "c")
+        graph.add_node("x")
+
+        result = graph.all_ancestors()
+        for node in graph.nodes():
+            assert result[node] == graph.ancestors(node), f"Mismatch for {node}"
+        assert result["d"] == {"a", "b", "c", "e"}
+        assert result["x"] == frozenset()
+
+        graph.add_edge("d", "a")
+        with pytest.raises(ValueError, match="Cycle detected"):
+            graph.all_ancestors()
+
     def test_shortest_path_length(self) -> None:
         """Test finding shortest path length between nodes."""
         graph = DiGraph()
@@ -166,6 +211,8 @@ class TestDiGraph:
         # b and c can be in any order, but both before d
         assert result2.index("b") < result2.index("d")
         assert result2.index("c") < result2.index("d")
+        # ready nodes of one layer are sorted, so the order is deterministic
+        assert result2 == ["a", "b", "c", "d"]
 
     def test_topological_sort_subgraph_with_cycle(self) -> None:
         """Test that topological sort raises error on cycles."""
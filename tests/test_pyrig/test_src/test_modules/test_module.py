@@ -19,6 +19,7 @@ from pyrig.src.modules.module import (
     get_default_module_content,
     get_isolated_obj_name,
     get_module_content_as_str,
+    get_module_docstring_as_str,
     get_module_name_replacing_start_module,
     import_module_from_file,
     import_module_with_default,
@@ -71,6 +72,22 @@ class TestClass:
             del sys.modules["test_module"]
 
 
+def test_get_module_docstring_as_str(tmp_path: Path) -> None:
+    """Test func for get_module_docstring_as_str."""
+    module_file = tmp_path / "docstring_module.py"
+    module_file.write_text('"""Docstring\n\nwith lines.\n"""\n\nx = """other"""\n')
+    module = ModuleType("docstring_module")
+    module.__file__ = str(module_file)
+
+    result = get_module_docstring_as_str(module)
+    assert result == "Docstring\n\nwith lines.\n", (
+        f"Expected raw docstring text, got {result!r}"
+    )
+    # cached per module, so the file is not read again
+    module_file.write_text('"""Changed."""\n')
+    assert get_module_docstring_as_str(module) == result, "Expected cached result"
+
+
 def test_create_module(tmp_path: Path) -> None:
     """Test func for create_module."""
     # Test creating a regular module
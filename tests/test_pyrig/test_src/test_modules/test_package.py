@@ -42,7 +42,7 @@ from tests.test_pyrig.test_src.test_modules.test_class_ import (
 )
 
 
-def test_find_packages(mocker: MockFixture) -> None:
+def test_find_packages(mocker: MockFixture, tmp_path: Path) -> None:
     """Test func for find_packages."""
     # Mock setuptools find_packages
     mock_find_packages = mocker.patch(
@@ -50,44 +50,39 @@ def test_find_packages(mocker: MockFixture) -> None:
         return_value=["package1", "package1.sub1", "package1.sub1.sub2", "package2"],
     )
 
-    # Mock read_text of Path to return empty list (no gitignore patterns)
-    mocker.patch(
-        "pathlib.Path.read_text",
-        return_value="",
-    )
+    # empty gitignore, so no gitignore patterns
+    with chdir(tmp_path):
+        Path(".gitignore").write_text("")
 
-    # Test without depth limit
-    result = find_packages()
-    expected = ["package1", "package1.sub1", "package1.sub1.sub2", "package2"]
-    assert result == expected, f"Expected {expected}, got {result}"
+        # Test without depth limit
+        result = find_packages()
+        expected = ["package1", "package1.sub1", "package1.sub1.sub2", "package2"]
+        assert result == expected, f"Expected {expected}, got {result}"
 
-    # Test with depth limit
-    result = find_packages(depth=1)
-    expected = ["package1", "package1.sub1", "package2"]
-    assert result == expected, f"Expected {expected}, got {result}"
+        # Test with depth limit
+        result = find_packages(depth=1)
+        expected = ["package1", "package1.sub1", "package2"]
+        assert result == expected, f"Expected {expected}, got {result}"
 
-    # Test with depth 0
-    result = find_packages(depth=0)
-    expected = ["package1", "package2"]
-    assert result == expected, f"Expected {expected}, got {result}"
+        # Test with depth 0
+        result = find_packages(depth=0)
+        expected = ["package1", "package2"]
+        assert result == expected, f"Expected {expected}, got {result}"
 
     # Verify that setuptools find_packages was called with empty exclude list
     mock_find_packages.assert_called_with(where=".", exclude=[], include=("*",))
 
 
-def test_find_packages_with_namespace(mocker: MockFixture) -> None:
+def test_find_packages_with_namespace(mocker: MockFixture, tmp_path: Path) -> None:
     """Test find_packages with namespace packages."""
     mock_find_namespace = mocker.patch(
         make_obj_importpath(packages) + "._find_namespace_packages",
         return_value=["ns_package1", "ns_package2"],
     )
 
-    mocker.patch(
-        "pathlib.Path.read_text",
-        return_value="",
-    )
-
-    result = find_packages(include_namespace_packages=True)
+    with chdir(tmp_path):
+        Path(".gitignore").write_text("")
+        result = find_packages(include_namespace_packages=True)
     expected = ["ns_package1", "ns_package2"]
     assert result == expected, f"Expected {expected}, got {result}"
 
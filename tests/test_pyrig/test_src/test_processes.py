@@ -2,7 +2,7 @@
 
 from pytest_mock import MockFixture
 
-from pyrig.src.processes import Args, run_subprocess
+from pyrig.src.processes import Args, build_args, run_subprocess
 
 
 def test_run_subprocess() -> None:
@@ -27,3 +27,11 @@ class TestArgs:
         args = Args(("uv", "--version"))
         args.run()
         mock_run_subprocess.assert_called_once()
+
+
+def test_build_args() -> None:
+    """Test func for build_args."""
+    args = build_args("uv", ("sync",))
+    assert isinstance(args, Args), f"Expected Args, got {type(args)}"
+    assert args == ("uv", "sync"), f"Expected uv sync, got {args}"
+    assert build_args("uv", ("sync",)) is args, "Expected interned Args"
@@ -85,6 +85,14 @@ def test_function() -> str:
     # should find it
     assert result is not None, f"Expected match for '{pattern}', got {result}"
 
+    # single quoted docstrings are excluded too, quotes nested in the other style
+    # do not end the docstring early
+    content = "'''Module with \"\"\" inside.'''\nvalue = 1\n"
+    result = re_search_excluding_docstrings(r"inside", content)
+    assert result is None, f"Expected no match in docstring, got {result}"
+    result = re_search_excluding_docstrings(r"value = 1", content)
+    assert result is not None, f"Expected match after docstring, got {result}"
+
 
 def test_starts_with_docstring() -> None:
     """Test function."""